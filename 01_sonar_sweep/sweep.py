@@ -1,20 +1,32 @@
+from typing import Iterable, Iterator
 import os
 INPUT_FILE = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def sonar_sweep():
+def sonar_sweep(filename=INPUT_FILE):
     """
     Each line is a measurement of the sea floor depth as the sweep 
     looks further and further away from the submarine.
     """
 
-    with open(INPUT_FILE) as file:
+    with open(filename) as file:
         lines = file.readlines()
 
     as_numbers = map(int, lines)
     return list(as_numbers)
 
 
+def stream_sonar_sweep(filename=INPUT_FILE) -> Iterator[int]:
+    """
+    Yields the depth measurements one at a time, so that the whole file
+    never needs to fit in memory.
+    """
+    with open(filename) as file:
+        for line in file:
+            if line.strip():
+                yield int(line)
+
+
 def count_increasing_numbers(data):
     """
     Counts the number of times a depth measurement increases 
@@ -30,6 +42,23 @@ def count_increasing_numbers(data):
     return increased
 
 
+def count_increasing_stream(depths: Iterable[int]) -> int:
+    """
+    Same as count_increasing_numbers, but works on any iterable (such as
+    a generator) by only remembering the previous measurement.
+    """
+    increased = 0
+    iterator = iter(depths)
+    previous = next(iterator, None)
+
+    for depth in iterator:
+        if depth > previous:
+            increased += 1
+        previous = depth
+
+    return increased
+
+
 if __name__ == '__main__':
     depths = sonar_sweep()
     increased = count_increasing_numbers(depths)
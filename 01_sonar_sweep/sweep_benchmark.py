@@ -0,0 +1,62 @@
+"""
+Compares the list based and the streaming depth counters on a generated
+depth log. Each variant runs in its own process so that the peak resident
+set sizes do not affect each other.
+
+Usage: python sweep_benchmark.py [number of measurements]
+"""
+from multiprocessing import Pool
+import random
+import resource
+import sys
+import tempfile
+import time
+from sweep import sonar_sweep, count_increasing_numbers, stream_sonar_sweep, count_increasing_stream
+
+
+def list_based(filename: str) -> int:
+    return count_increasing_numbers(sonar_sweep(filename))
+
+
+def streaming(filename: str) -> int:
+    return count_increasing_stream(stream_sonar_sweep(filename))
+
+
+def write_depth_log(file, count: int):
+    """
+    Writes a random walk of depth measurements into the given file.
+    """
+    depth = 1_000
+    for _ in range(count):
+        depth = max(0, depth + random.randint(-5, 5))
+        file.write(f'{depth}\n')
+    file.flush()
+
+
+def measure(func, filename: str) -> tuple:
+    """
+    Runs the function and returns (result, seconds, peak RSS in kilobytes).
+    """
+    start = time.perf_counter()
+    result = func(filename)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result, elapsed, peak
+
+
+def run_isolated(func, filename: str) -> tuple:
+    # maxtasksperchild=1 gives each measurement a fresh process
+    with Pool(1, maxtasksperchild=1) as pool:
+        return pool.apply(measure, (func, filename))
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+
+    with tempfile.NamedTemporaryFile('w', suffix='.txt') as file:
+        write_depth_log(file, count)
+
+        for func in (list_based, streaming):
+            result, elapsed, peak = run_isolated(func, file.name)
+            print(f'{func.__name__:>10}: {result} increases, '
+                  f'{count / elapsed:,.0f} measurements/s, peak RSS {peak / 1024:,.1f} MiB')
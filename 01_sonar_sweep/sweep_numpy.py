@@ -0,0 +1,45 @@
+"""
+Vectorized versions of the sonar sweep counters. NumPy is optional: when it
+is not installed, the functions fall back to the pure Python implementations.
+"""
+from sweep import INPUT_FILE, sonar_sweep, count_increasing_numbers
+from sweep_sliding import group_measurements
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python version is used without it
+    np = None
+
+
+def read_depths(filename=INPUT_FILE):
+    """
+    Reads all depth measurements at once into an int32 array, or into a
+    list if NumPy is not available.
+    """
+    if np is None:
+        return sonar_sweep(filename)
+    return np.fromfile(filename, dtype=np.int32, sep=' ')
+
+
+def count_increases(depths) -> int:
+    """
+    Counts the number of times a depth measurement increases from the previous one.
+    """
+    if np is None:
+        return count_increasing_numbers(depths)
+    return int(np.count_nonzero(np.diff(depths) > 0))
+
+
+def count_window_increases(depths, width=3) -> int:
+    """
+    Counts the number of times the sum of a sliding window increases
+    from the previous sum.
+    """
+    return count_increases(group_measurements(depths, width))
+
+
+if __name__ == '__main__':
+    depths = read_depths()
+
+    print(f'Depth increased {count_increases(depths)} times!')
+    print(f'Sliding window depth increased {count_window_increases(depths)} times!')
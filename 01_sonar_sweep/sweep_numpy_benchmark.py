@@ -0,0 +1,47 @@
+"""
+Compares the pure Python and the NumPy depth counters on generated depth logs.
+
+Usage: python sweep_numpy_benchmark.py [sizes...], for example
+python sweep_numpy_benchmark.py 1000000 10000000 100000000
+"""
+import sys
+import tempfile
+import time
+import numpy as np
+from sweep import sonar_sweep, count_increasing_numbers
+from sweep_sliding import group_measurements
+from sweep_numpy import read_depths, count_increases, count_window_increases
+
+
+def pure_python(filename: str) -> tuple:
+    depths = sonar_sweep(filename)
+    return count_increasing_numbers(depths), count_increasing_numbers(group_measurements(depths))
+
+
+def vectorized(filename: str) -> tuple:
+    depths = read_depths(filename)
+    return count_increases(depths), count_window_increases(depths)
+
+
+def timed(func, filename: str) -> tuple:
+    start = time.perf_counter()
+    result = func(filename)
+    return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000, 10_000_000]
+
+    for size in sizes:
+        walk = 1_000 + np.cumsum(np.random.randint(-5, 6, size=size, dtype=np.int32))
+
+        with tempfile.NamedTemporaryFile('w', suffix='.txt') as file:
+            np.savetxt(file, np.abs(walk), fmt='%d')
+            file.flush()
+
+            python_result, python_time = timed(pure_python, file.name)
+            numpy_result, numpy_time = timed(vectorized, file.name)
+
+        assert python_result == numpy_result
+        print(f'{size:>12,} readings: pure Python {python_time:.2f}s, '
+              f'NumPy {numpy_time:.2f}s, speedup {python_time / numpy_time:.1f}x')
@@ -0,0 +1,44 @@
+from sweep import sonar_sweep, count_increasing_numbers
+from sweep_sliding import group_measurements
+import sweep_numpy
+import pytest
+
+
+def test_read_depths_matches_sonar_sweep():
+    assert list(sweep_numpy.read_depths()) == sonar_sweep()
+
+
+def test_counts_match_pure_python():
+    depths = sonar_sweep()
+    expected = count_increasing_numbers(depths)
+    expected_windows = count_increasing_numbers(group_measurements(depths))
+
+    as_array = sweep_numpy.read_depths()
+    assert sweep_numpy.count_increases(as_array) == expected
+    assert sweep_numpy.count_window_increases(as_array) == expected_windows
+
+
+def test_fallback_without_numpy(monkeypatch):
+    monkeypatch.setattr(sweep_numpy, 'np', None)
+    nums = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+
+    assert isinstance(sweep_numpy.read_depths(), list)
+    assert sweep_numpy.count_increases(nums) == 7
+    assert sweep_numpy.count_window_increases(nums) == 5
+
+
+def test_vectorized_counts_with_aoc_example():
+    np = pytest.importorskip('numpy')
+    nums = np.array([199, 200, 208, 210, 200, 207, 240, 269, 260, 263], dtype=np.int32)
+
+    assert sweep_numpy.count_increases(nums) == 7
+    assert sweep_numpy.count_window_increases(nums) == 5
+
+
+def test_empty_depth_file(tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.write_text('')
+    depths = sweep_numpy.read_depths(str(path))
+
+    assert sweep_numpy.count_increases(depths) == 0
+    assert sweep_numpy.count_window_increases(depths) == 0
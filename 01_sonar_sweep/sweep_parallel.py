@@ -0,0 +1,100 @@
+"""
+Counts depth increases of very large depth logs in parallel. The input file is
+memory mapped and split into chunks on newline boundaries, each chunk is counted
+in its own process and the chunk results are merged in order.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+import mmap
+import os
+from sweep import INPUT_FILE, count_increasing_numbers
+from sweep_sliding import group_measurements
+
+# (number of increases inside the chunk, first values of the chunk, last values of the chunk)
+ChunkResult = Tuple[int, List[int], List[int]]
+
+
+def find_chunk_boundaries(data: mmap.mmap, chunks: int) -> List[Tuple[int, int]]:
+    """
+    Splits the mapped file into roughly equal sized (start, end) byte ranges
+    so that each range ends right after a newline character.
+    """
+    size = len(data)
+    boundaries = [0]
+
+    for i in range(1, chunks):
+        newline = data.find(b'\n', max(size * i // chunks, boundaries[-1]))
+        if newline == -1:
+            break
+        if newline + 1 > boundaries[-1]:
+            boundaries.append(newline + 1)
+
+    if boundaries[-1] < size:
+        boundaries.append(size)
+
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def scan_chunk(filename: str, start: int, end: int, width: int) -> ChunkResult:
+    """
+    Counts the window increases that fall completely inside the given byte range.
+    The first and last `width` measurements are returned for handling the seams
+    between neighbouring chunks.
+    """
+    with open(filename, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            depths = list(map(int, data[start:end].split()))
+
+    increased = count_increasing_numbers(group_measurements(depths, width))
+    return increased, depths[:width], depths[-width:]
+
+
+def merge_chunk_results(results: List[ChunkResult], width: int) -> int:
+    """
+    Sums the chunk counts and adds the increases of the windows that span
+    over the seams. A window sum increases when the measurement entering the
+    window is greater than the one leaving it, so only pairs of measurements
+    `width` steps apart need to be compared across the seam.
+    """
+    increased = 0
+    carry: List[int] = []  # last `width` measurements before the current chunk
+
+    for chunk_increases, head, tail in results:
+        increased += chunk_increases
+
+        for j, entering in enumerate(head):
+            leaving = len(carry) + j - width
+            if 0 <= leaving < len(carry) and entering > carry[leaving]:
+                increased += 1
+
+        # a chunk shorter than the window does not replace the whole carry
+        carry = (carry + head)[-width:] if len(head) < width else tail
+
+    return increased
+
+
+def count_increases_parallel(filename=INPUT_FILE, width=1, workers=None, chunks=None) -> int:
+    """
+    Counts how many times the sum of a sliding window of the given width
+    increases. With width 1 this is the plain sonar sweep count.
+    """
+    if os.path.getsize(filename) == 0:
+        return 0
+
+    workers = workers or os.cpu_count()
+    chunks = chunks or workers * 4
+
+    with open(filename, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            ranges = find_chunk_boundaries(data, chunks)
+
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(scan_chunk, filename, start, end, width) for start, end in ranges]
+        results = [future.result() for future in futures]
+
+    return merge_chunk_results(results, width)
+
+
+if __name__ == '__main__':
+    print(f'Depth increased {count_increases_parallel()} times!')
+    print(f'Sliding window depth increased {count_increases_parallel(width=3)} times!')
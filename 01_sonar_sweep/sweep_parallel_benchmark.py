@@ -0,0 +1,27 @@
+"""
+Measures how the parallel depth scan scales with the number of worker processes.
+
+Usage: python sweep_parallel_benchmark.py [number of measurements]
+"""
+import os
+import sys
+import tempfile
+import time
+from sweep_benchmark import write_depth_log
+from sweep_parallel import count_increases_parallel
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+
+    with tempfile.NamedTemporaryFile('w', suffix='.txt') as file:
+        write_depth_log(file, count)
+
+        workers = 1
+        while workers <= os.cpu_count():
+            start = time.perf_counter()
+            result = count_increases_parallel(file.name, width=3, workers=workers)
+            elapsed = time.perf_counter() - start
+
+            print(f'{workers:>3} workers: {result} increases in {elapsed:.2f}s')
+            workers *= 2
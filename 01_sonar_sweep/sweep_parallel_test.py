@@ -0,0 +1,56 @@
+from sweep import count_increasing_numbers
+from sweep_sliding import group_measurements
+from sweep_parallel import count_increases_parallel, find_chunk_boundaries, merge_chunk_results, scan_chunk
+import mmap
+from pytest import fixture
+
+
+@fixture
+def depth_file(tmp_path):
+    depths = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263, 250, 251, 255]
+    path = tmp_path / 'depths.txt'
+    path.write_text(''.join(f'{depth}\n' for depth in depths))
+    return str(path), depths
+
+
+def test_chunk_boundaries_end_at_newlines(depth_file):
+    filename, _ = depth_file
+
+    with open(filename, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            ranges = find_chunk_boundaries(data, 4)
+            contents = bytes(data)
+
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(contents)
+    assert all(contents[end - 1:end] == b'\n' for _, end in ranges)
+    assert all(prev_end == start for (_, prev_end), (start, _) in zip(ranges, ranges[1:]))
+
+
+def test_merging_handles_seams_with_tiny_chunks(depth_file):
+    filename, depths = depth_file
+
+    with open(filename, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            ranges = find_chunk_boundaries(data, len(depths))
+
+    for width in (1, 3, 5):
+        results = [scan_chunk(filename, start, end, width) for start, end in ranges]
+        expected = count_increasing_numbers(group_measurements(depths, width))
+
+        assert merge_chunk_results(results, width) == expected
+
+
+def test_count_increases_parallel(depth_file):
+    filename, depths = depth_file
+
+    assert count_increases_parallel(filename, workers=2, chunks=3) == count_increasing_numbers(depths)
+    assert count_increases_parallel(filename, width=3, workers=2, chunks=5) == \
+        count_increasing_numbers(group_measurements(depths))
+
+
+def test_count_increases_parallel_with_empty_file(tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.write_text('')
+
+    assert count_increases_parallel(str(path)) == 0
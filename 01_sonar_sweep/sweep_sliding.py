@@ -1,19 +1,59 @@
+from typing import List, Sequence
 from sweep import sonar_sweep, count_increasing_numbers
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python version is used without it
+    np = None
 
-def group_measurements(data):
+
+def group_measurements(data, width=3):
     """
     'Consider sums of a three-measurement sliding window.'
+
+    NumPy arrays are summed with the vectorized backend, everything else
+    with a running sum.
+    """
+    if np is not None and isinstance(data, np.ndarray):
+        return rolling_sums_numpy(data, width)
+    return rolling_sums(data, width)
+
+
+def rolling_sums(data: Sequence[int], width: int) -> List[int]:
+    """
+    Returns the sums of each window of the given width. The running sum
+    is updated by adding the incoming and subtracting the outgoing value,
+    so each step costs the same regardless of the width.
     """
-    result = []
+    if width < 1:
+        raise ValueError(f'Window width must be positive, got {width}')
+    if len(data) < width:
+        return []
 
-    for i in range(0, len(data) - 2):
-        sum_of_three = sum(data[i:i+3])
-        result.append(sum_of_three)
+    window_sum = sum(data[:width])
+    result = [window_sum]
+
+    for i in range(width, len(data)):
+        window_sum += data[i] - data[i - width]
+        result.append(window_sum)
 
     return result
 
 
+def rolling_sums_numpy(data, width: int):
+    """
+    Vectorized rolling_sums: the window sums are differences of a
+    cumulative sum array.
+    """
+    if width < 1:
+        raise ValueError(f'Window width must be positive, got {width}')
+    if len(data) < width:
+        return np.empty(0, dtype=np.int64)
+
+    cumulative = np.concatenate(([0], np.cumsum(data, dtype=np.int64)))
+    return cumulative[width:] - cumulative[:-width]
+
+
 if __name__ == '__main__':
     """
     Your goal now is to count the number of times the sum of measurements 
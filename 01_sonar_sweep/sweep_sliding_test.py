@@ -1,7 +1,32 @@
-from sweep_sliding import group_measurements
+from sweep_sliding import group_measurements, rolling_sums, rolling_sums_numpy
+import pytest
 
 
 def test_group_measurements_sums_each_three_numbers_in_row():
     nums = [0, 1, 2, 3, 4, 5]
 
     assert group_measurements(nums) == [3, 6, 9, 12]
+
+
+def test_rolling_sums_with_custom_width():
+    nums = [0, 1, 2, 3, 4, 5]
+
+    assert rolling_sums(nums, 1) == nums
+    assert rolling_sums(nums, 4) == [6, 10, 14]
+    assert rolling_sums(nums, 6) == [15]
+    assert rolling_sums(nums, 7) == []
+
+
+def test_rolling_sums_rejects_invalid_width():
+    with pytest.raises(ValueError):
+        rolling_sums([1, 2, 3], 0)
+
+
+def test_rolling_sums_numpy_matches_pure_python():
+    np = pytest.importorskip('numpy')
+    nums = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+
+    for width in range(1, 12):
+        assert rolling_sums_numpy(np.array(nums), width).tolist() == rolling_sums(nums, width)
+
+    assert group_measurements(np.array(nums)).tolist() == rolling_sums(nums, 3)
@@ -1,4 +1,4 @@
-from sweep import count_increasing_numbers, sonar_sweep
+from sweep import count_increasing_numbers, sonar_sweep, count_increasing_stream, stream_sonar_sweep
 
 
 def test_only_increasing_numbers():
@@ -32,3 +32,17 @@ def test_reading_file():
 
     assert results[0] == 159
     assert results[-1] == 8_568
+
+
+def test_count_increasing_stream_matches_list_version():
+    nums = [0, 100, 10, 200, 200, 500, 1]
+
+    assert count_increasing_stream(iter(nums)) == count_increasing_numbers(nums)
+
+
+def test_count_increasing_stream_with_empty_input():
+    assert count_increasing_stream(iter([])) == 0
+
+
+def test_streaming_file():
+    assert list(stream_sonar_sweep()) == sonar_sweep()
@@ -1,36 +1,77 @@
+from array import array
 from collections import namedtuple
+from typing import Iterable
 import os
 
 INPUT_FILE = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 Command = namedtuple('Command', 'direction amount')
 
+# The course in columnar form: direction opcodes in array('b') and amounts in array('q')
+Course = namedtuple('Course', 'directions amounts')
+
+FORWARD, DOWN, UP = 0, 1, 2
+OPCODES = {'forward': FORWARD, 'down': DOWN, 'up': UP}
+
 
 def parse_line(line):
     direction, amount = line.split(' ')
     return Command(direction, int(amount))
 
 
-def read_course_file():
+def read_course_file(filename=INPUT_FILE):
     """
     The submarine seems to already have a planned course (your puzzle input).
     """
-    with open(INPUT_FILE) as file:
+    with open(filename) as file:
         lines = file.readlines()
 
     return list(map(parse_line, lines))
 
 
+def to_columns(commands: Iterable[tuple]) -> Course:
+    """
+    Converts (direction, amount) pairs into a Course where each direction
+    is interned into a small integer opcode.
+    """
+    directions = array('b')
+    amounts = array('q')
+
+    for direction, amount in commands:
+        if direction not in OPCODES:
+            raise ValueError(f'Unknown direction: {direction}')
+        directions.append(OPCODES[direction])
+        amounts.append(amount)
+
+    return Course(directions, amounts)
+
+
+def read_course_columns(filename=INPUT_FILE) -> Course:
+    """
+    Reads the planned course directly into columns. The parsed Commands
+    are consumed one at a time and never stored in a list.
+    """
+    with open(filename) as file:
+        return to_columns(map(parse_line, filter(str.strip, file)))
+
+
 def dive(course):
-    fwd = sum(c.amount for c in course if c.direction == 'forward')
-    up = sum(c.amount for c in course if c.direction == 'up')
-    down = sum(c.amount for c in course if c.direction == 'down')
+    """
+    Sums the forward, down and up amounts in a single pass and returns
+    the final (horizontal, depth) position.
+    """
+    if not isinstance(course, Course):
+        course = to_columns(course)
+
+    totals = [0, 0, 0]
+    for opcode, amount in zip(course.directions, course.amounts):
+        totals[opcode] += amount
 
-    return (fwd, down - up)
+    return (totals[FORWARD], totals[DOWN] - totals[UP])
 
 
 if __name__ == '__main__':
-    course = read_course_file()
+    course = read_course_columns()
     horizontal, depth = dive(course)
 
     print(horizontal * depth)
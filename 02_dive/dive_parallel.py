@@ -0,0 +1,90 @@
+"""
+The aim based dive as an associative reduction. The effect of any run of
+commands is an affine transform of the (horizontal, depth, aim) state:
+
+    (h, d, a) -> (h + dh, d + dd + a * dh, a + da)
+
+so a long course can be split into chunks whose transforms are computed in
+parallel and then composed in order.
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import Iterable, List, Tuple
+import os
+from dive import INPUT_FILE, parse_line, to_columns
+from dive_with_aim import run_with_aim
+
+Transform = namedtuple('Transform', 'horizontal depth aim')
+
+IDENTITY = Transform(0, 0, 0)
+
+
+def compose(first: Transform, second: Transform) -> Transform:
+    """
+    Returns the transform of applying `first` and then `second`. The forward
+    moves of `second` dive deeper by the aim that `first` leaves behind.
+    """
+    return Transform(first.horizontal + second.horizontal,
+                     first.depth + second.depth + first.aim * second.horizontal,
+                     first.aim + second.aim)
+
+
+def course_transform(course: Iterable[tuple]) -> Transform:
+    """
+    Simulates the commands starting from zero aim and returns their combined transform.
+    """
+    return Transform(*run_with_aim(course))
+
+
+def find_chunk_boundaries(filename: str, chunks: int) -> List[Tuple[int, int]]:
+    """
+    Splits the file into roughly equal sized (start, end) byte ranges that
+    begin at the start of a line.
+    """
+    size = os.path.getsize(filename)
+    boundaries = [0]
+
+    with open(filename, 'rb') as file:
+        for i in range(1, chunks):
+            file.seek(max(size * i // chunks, boundaries[-1]))
+            file.readline()  # skip to the start of the next line
+            if file.tell() > boundaries[-1]:
+                boundaries.append(file.tell())
+
+    if boundaries[-1] < size:
+        boundaries.append(size)
+
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def chunk_transform(filename: str, start: int, end: int) -> Transform:
+    """
+    Parses the commands in the given byte range and returns their transform.
+    """
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        lines = file.read(end - start).decode().splitlines()
+
+    return course_transform(to_columns(map(parse_line, filter(str.strip, lines))))
+
+
+def dive_parallel(filename=INPUT_FILE, workers=None, chunks=None) -> Tuple[int, int]:
+    """
+    Computes the final (horizontal, depth) of the aim based dive by reducing
+    the chunk transforms of the course file in a process pool.
+    """
+    workers = workers or os.cpu_count()
+    ranges = find_chunk_boundaries(filename, chunks or workers * 4)
+
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(chunk_transform, filename, start, end) for start, end in ranges]
+        total = reduce(compose, (future.result() for future in futures), IDENTITY)
+
+    return (total.horizontal, total.depth)
+
+
+if __name__ == '__main__':
+    horizontal, depth = dive_parallel()
+
+    print(horizontal * depth)
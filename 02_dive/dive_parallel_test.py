@@ -0,0 +1,39 @@
+from dive_with_aim import dive_with_aim
+from dive_with_aim_test import SAMPLE_COURSE
+from dive_parallel import compose, course_transform, dive_parallel, find_chunk_boundaries, IDENTITY
+from pytest import fixture
+
+
+@fixture
+def sample_course():
+    return list(SAMPLE_COURSE)
+
+
+def test_composing_split_courses(sample_course):
+    for split in range(len(sample_course) + 1):
+        left = course_transform(sample_course[:split])
+        right = course_transform(sample_course[split:])
+
+        assert compose(left, right) == course_transform(sample_course)
+
+
+def test_compose_is_associative(sample_course):
+    a, b, c = (course_transform(sample_course[i:i + 2]) for i in (0, 2, 4))
+
+    assert compose(compose(a, b), c) == compose(a, compose(b, c))
+    assert compose(IDENTITY, a) == compose(a, IDENTITY) == a
+
+
+def test_dive_parallel_matches_dive_with_aim(sample_course, tmp_path):
+    path = tmp_path / 'course.txt'
+    path.write_text(''.join(f'{command} {amount}\n' for command, amount in sample_course))
+
+    assert dive_parallel(str(path), workers=2, chunks=4) == dive_with_aim(sample_course)
+
+
+def test_chunk_boundaries_start_at_lines(tmp_path):
+    path = tmp_path / 'course.txt'
+    path.write_bytes(b'forward 5\ndown 5\nforward 8\n')
+
+    ranges = find_chunk_boundaries(str(path), 10)
+    assert ranges == [(0, 10), (10, 17), (17, 27)]
@@ -1,4 +1,5 @@
-from dive import read_course_file, parse_line, dive, Command
+from dive import read_course_file, read_course_columns, parse_line, dive, to_columns, Command, FORWARD, DOWN, UP
+import pytest
 
 
 def test_reading_submarine_course():
@@ -26,3 +27,23 @@ def test_dive():
     ])
     assert horizontal == 15
     assert depth == 10
+
+
+def test_to_columns_interns_directions():
+    course = to_columns([Command('forward', 5), Command('down', 3), Command('up', 2)])
+
+    assert list(course.directions) == [FORWARD, DOWN, UP]
+    assert list(course.amounts) == [5, 3, 2]
+
+
+def test_to_columns_rejects_unknown_direction():
+    with pytest.raises(ValueError):
+        to_columns([Command('sideways', 1)])
+
+
+def test_read_course_columns_matches_commands():
+    commands = read_course_file()
+    course = read_course_columns()
+
+    assert course == to_columns(commands)
+    assert dive(course) == dive(commands)
@@ -1,24 +1,46 @@
-from dive import read_course_file
+from typing import Tuple
+from dive import read_course_columns, to_columns, Course, FORWARD, DOWN, UP
 
 
-def dive_with_aim(course):
-    aim = 0
-    horizontal = 0
-    depth = 0
+def aim_step(horizontal: int, depth: int, aim: int, opcode: int, amount: int) -> Tuple[int, int, int]:
+    """
+    Applies a single command to the (horizontal, depth, aim) state.
+    """
+    if opcode == FORWARD:
+        return horizontal + amount, depth + aim * amount, aim
+    elif opcode == UP:
+        return horizontal, depth, aim - amount
+    elif opcode == DOWN:
+        return horizontal, depth, aim + amount
+    return horizontal, depth, aim
+
+
+def run_with_aim(course, horizontal=0, depth=0, aim=0) -> Tuple[int, int, int]:
+    """
+    Runs the course from the given state and returns the final (horizontal, depth, aim).
+    """
+    if not isinstance(course, Course):
+        course = to_columns(course)
 
-    for command, amount in course:
-        if command == 'forward':
+    # the branches of aim_step are inlined, a function call per command is too slow here
+    for opcode, amount in zip(course.directions, course.amounts):
+        if opcode == FORWARD:
             horizontal += amount
             depth += aim * amount
-        elif command == 'up':
+        elif opcode == UP:
             aim -= amount
-        elif command == 'down':
+        elif opcode == DOWN:
             aim += amount
+    return (horizontal, depth, aim)
+
+
+def dive_with_aim(course):
+    horizontal, depth, _ = run_with_aim(course)
     return (horizontal, depth)
 
 
 if __name__ == '__main__':
-    course = read_course_file()
+    course = read_course_columns()
     horizontal, depth = dive_with_aim(course)
 
     print(horizontal * depth)
@@ -1,14 +1,28 @@
-from dive_with_aim import dive_with_aim
+from dive_with_aim import dive_with_aim, run_with_aim
+from dive import to_columns
+
+# The example course from the puzzle description
+SAMPLE_COURSE = [
+    ('forward', 5),
+    ('down', 5),
+    ('forward', 8),
+    ('up', 3),
+    ('down', 8),
+    ('forward', 2)
+]
 
 
 def test_dive_with_aim():
-    horizontal, depth = dive_with_aim([
-        ('forward', 5),
-        ('down', 5),
-        ('forward', 8),
-        ('up', 3),
-        ('down', 8),
-        ('forward', 2)
-    ])
+    horizontal, depth = dive_with_aim(SAMPLE_COURSE)
     assert horizontal == 15
     assert depth == 60
+
+
+def test_dive_with_aim_over_columns():
+    course = to_columns(SAMPLE_COURSE)
+    assert dive_with_aim(course) == (15, 60)
+
+
+def test_run_with_aim_continues_from_state():
+    assert run_with_aim([('down', 5), ('forward', 8)]) == (8, 40, 5)
+    assert run_with_aim([('forward', 2)], 13, 40, 5) == (15, 50, 5)
@@ -0,0 +1,76 @@
+"""
+Prefix snapshots of the aim based dive, so that the state of the submarine
+after any command of a long course can be looked up without re-simulating it.
+"""
+from collections import namedtuple
+from typing import Iterable, List
+from dive import read_course_columns, to_columns, Course
+from dive_with_aim import aim_step
+
+State = namedtuple('State', 'horizontal depth aim')
+
+
+class TrajectoryIndex:
+    """
+    Stores the (horizontal, depth, aim) state after each command. Index 0
+    is the starting state before any commands.
+    """
+
+    def __init__(self, course: Iterable[tuple] = ()) -> None:
+        self._horizontal: List[int] = [0]
+        self._depth: List[int] = [0]
+        self._aim: List[int] = [0]
+        self.extend(course)
+
+    def append(self, opcode: int, amount: int):
+        """
+        Adds a single command, given as an opcode, to the end of the course.
+        """
+        horizontal, depth, aim = aim_step(self._horizontal[-1], self._depth[-1], self._aim[-1], opcode, amount)
+
+        self._horizontal.append(horizontal)
+        self._depth.append(depth)
+        self._aim.append(aim)
+
+    def extend(self, course: Iterable[tuple]):
+        """
+        Adds a Course or (direction, amount) pairs to the end of the course.
+        """
+        if not isinstance(course, Course):
+            course = to_columns(course)
+
+        for opcode, amount in zip(course.directions, course.amounts):
+            self.append(opcode, amount)
+
+    def state_after(self, k: int) -> State:
+        """
+        Returns the state after the first k commands in O(1).
+        """
+        if not 0 <= k <= len(self):
+            raise IndexError(f'Command index {k} out of range 0..{len(self)}')
+        return State(self._horizontal[k], self._depth[k], self._aim[k])
+
+    def range_state(self, start: int, end: int) -> State:
+        """
+        Returns the state that the commands start..end-1 would produce on their
+        own, starting from zero aim. Forward moves in the range gain depth by
+        their aim, which is the prefix aim minus the aim at `start`.
+        """
+        if not 0 <= start <= end <= len(self):
+            raise IndexError(f'Command range {start}..{end} out of range 0..{len(self)}')
+
+        begin, finish = self.state_after(start), self.state_after(end)
+        horizontal = finish.horizontal - begin.horizontal
+        depth = finish.depth - begin.depth - begin.aim * horizontal
+
+        return State(horizontal, depth, finish.aim - begin.aim)
+
+    def __len__(self) -> int:
+        return len(self._horizontal) - 1
+
+
+if __name__ == '__main__':
+    index = TrajectoryIndex(read_course_columns())
+
+    for k in range(len(index) + 1):
+        print(k, index.state_after(k))
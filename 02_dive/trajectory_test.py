@@ -0,0 +1,54 @@
+from dive import to_columns, DOWN, FORWARD
+from dive_with_aim import dive_with_aim
+from dive_with_aim_test import SAMPLE_COURSE
+from trajectory import TrajectoryIndex, State
+import pytest
+from pytest import fixture
+
+
+@fixture
+def sample_course():
+    return list(SAMPLE_COURSE)
+
+
+def test_state_after_each_command(sample_course):
+    index = TrajectoryIndex(sample_course)
+
+    assert len(index) == 6
+    assert index.state_after(0) == State(0, 0, 0)
+    assert index.state_after(3) == State(13, 40, 5)
+    assert index.state_after(6) == State(15, 60, 10)
+
+    for k in range(len(sample_course) + 1):
+        horizontal, depth = dive_with_aim(sample_course[:k])
+        assert index.state_after(k)[:2] == (horizontal, depth)
+
+
+def test_range_state_matches_simulating_the_range(sample_course):
+    index = TrajectoryIndex(sample_course)
+
+    for start in range(len(sample_course) + 1):
+        for end in range(start, len(sample_course) + 1):
+            state = index.range_state(start, end)
+            assert state[:2] == dive_with_aim(sample_course[start:end])
+
+
+def test_incremental_appends(sample_course):
+    index = TrajectoryIndex(sample_course[:2])
+    index.extend(to_columns(sample_course[2:5]))
+    index.append(FORWARD, 2)
+
+    assert index.state_after(6) == TrajectoryIndex(sample_course).state_after(6)
+
+    index.append(DOWN, 1)
+    assert index.state_after(7) == State(15, 60, 11)
+
+
+def test_out_of_range_queries(sample_course):
+    index = TrajectoryIndex(sample_course)
+
+    with pytest.raises(IndexError):
+        index.state_after(7)
+
+    with pytest.raises(IndexError):
+        index.range_state(4, 2)
@@ -1,7 +1,21 @@
 import os
+from collections import namedtuple
+from functools import reduce
 from typing import List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python version is used without it
+    np = None
+
 INPUT_FILE = os.path.join(os.path.dirname(__file__), 'input.txt')
 
+# A report of binary numbers packed into ints, with the number of bits in each
+PackedReport = namedtuple('PackedReport', 'numbers width')
+
+# A single binary number packed into an int
+PackedBits = namedtuple('PackedBits', 'value width')
+
 
 def convert_to_bits(line: str) -> List[int]:
     """
@@ -10,18 +24,76 @@ def convert_to_bits(line: str) -> List[int]:
     return list(map(int, line))
 
 
-def read_report() -> List[List[int]]:
+def read_report(filename=INPUT_FILE) -> List[List[int]]:
     """
     The diagnostic report (your puzzle input) consists of a list of binary numbers which,
     when decoded properly, can tell you many useful things about the conditions of the
     submarine. The first parameter to check is the power consumption.
     """
-    with open(INPUT_FILE) as file:
+    with open(filename) as file:
         lines = file.read().splitlines()
 
     return list(map(convert_to_bits, lines))
 
 
+def read_packed_report(filename=INPUT_FILE) -> PackedReport:
+    """
+    Reads the diagnostic report so that each binary number is parsed into a
+    single int instead of a list of bits.
+    """
+    with open(filename) as file:
+        lines = file.read().split()
+
+    width = len(lines[0]) if lines else 0
+    return PackedReport([int(line, 2) for line in lines], width)
+
+
+def read_report_matrix(filename=INPUT_FILE):
+    """
+    Reads the diagnostic report into a 2-dimensional uint8 NumPy matrix with
+    one row per binary number and one column per bit position. Without NumPy
+    the report is read with read_report instead.
+    """
+    if np is None:
+        return read_report(filename)
+
+    with open(filename) as file:
+        lines = file.read().split()
+
+    digits = np.frombuffer(''.join(lines).encode(), dtype=np.uint8) - ord('0')
+    return digits.reshape(len(lines), len(lines[0]) if lines else 0)
+
+
+def pack_report(data: List[List[int]]) -> PackedReport:
+    """
+    Converts a report of bit lists into a PackedReport.
+    """
+    width = len(data[0]) if data else 0
+    return PackedReport([bits_to_decimal(bits) for bits in data], width)
+
+
+def count_ones(report: PackedReport) -> List[int]:
+    """
+    Returns the number of ones in each bit position, most significant bit first.
+    Masking a position and summing gives the count multiplied by the position
+    value, so the count is recovered with a single shift.
+
+    With NumPy each column is counted with a vectorized mask over a uint64 array
+    of the numbers. The numbers can already be given as such an array to avoid
+    converting them on every call.
+    """
+    if np is not None and report.width <= 64:
+        numbers = np.asarray(report.numbers, dtype=np.uint64)
+        return [int(np.count_nonzero(numbers & np.uint64(1 << shift)))
+                for shift in reversed(range(report.width))]
+
+    counts = []
+    for shift in reversed(range(report.width)):
+        mask = 1 << shift
+        counts.append(sum(number & mask for number in report.numbers) >> shift)
+    return counts
+
+
 def most_common_bit(bits: List[int]) -> int:
     """
     Returns the most common bit in given list. In case of a tie, returns 1.
@@ -37,7 +109,20 @@ def find_most_common_bits(data: List[List[int]]) -> List[int]:
     """
     Returns a list of most common bits in each position across multiple bit lists.
     In case of a tie between ones and zeros, uses 1.
+
+    For a PackedReport the most common bits are returned as PackedBits.
     """
+    if isinstance(data, PackedReport):
+        total = len(data.numbers)
+        common = 0
+        for ones in count_ones(data):
+            common = common << 1 | (ones * 2 >= total)
+        return PackedBits(common, data.width)
+
+    if np is not None and isinstance(data, np.ndarray):
+        ones = data.sum(axis=0, dtype=np.int64)
+        return (ones * 2 >= len(data)).astype(int).tolist()
+
     zipped = zip(*data)
     common_bits = map(most_common_bit, zipped)
     return list(common_bits)
@@ -47,20 +132,24 @@ def invert_bits(bits: List[int]) -> List[int]:
     """
     Returns a new list with ones as zeros and vice versa
     """
+    if isinstance(bits, PackedBits):
+        return PackedBits(bits.value ^ ((1 << bits.width) - 1), bits.width)
+
     def invert(bit): return bit ^ 1  # bitwise xor changes 0 to 1 and 1 to 0
     return list(map(invert, bits))
 
 
 def bits_to_decimal(bits: List[int]) -> int:
     """
-    Converts a list of int bits to a decimal number
+    Converts a list of int bits or PackedBits to a decimal number
     """
-    binary_str = ''.join(map(str, bits))
-    return int(binary_str, 2)
+    if isinstance(bits, PackedBits):
+        return bits.value
+    return reduce(lambda number, bit: number << 1 | bit, bits, 0)
 
 
 if __name__ == '__main__':
-    report = read_report()
+    report = read_packed_report()
     gamma_bits = find_most_common_bits(report)
     epsilon_bits = invert_bits(gamma_bits)
 
@@ -1,5 +1,6 @@
-from typing import List
-from diagnostic import read_report, find_most_common_bits, bits_to_decimal
+from bisect import bisect_left
+from typing import List, Tuple
+from diagnostic import read_packed_report, find_most_common_bits, bits_to_decimal, pack_report, PackedReport
 
 
 def filter_by_common_bits_in_each_position(report: List[List[int]], most_common=True) -> List[int]:
@@ -44,9 +45,50 @@ def find_co2_generator_rating(report: List[List[int]]) -> int:
     return bits_to_decimal(filtered[0])
 
 
+def search_sorted_rating(numbers: List[int], width: int, most_common=True) -> int:
+    """
+    Finds a rating from sorted packed numbers. The numbers sharing the bits chosen
+    so far form a contiguous range, and within that range the numbers with a zero
+    in the next position come before the ones with a one. The counts of zeros
+    and ones are therefore found with a binary search instead of a filter.
+    """
+    low, high = 0, len(numbers)
+    prefix = 0
+
+    for shift in reversed(range(width)):
+        if high - low == 1:
+            break
+
+        split = bisect_left(numbers, prefix | (1 << shift), low, high)
+        zeros, ones = split - low, high - split
+
+        keep_ones = ones >= zeros if most_common else ones < zeros
+        # never filter out every remaining number
+        keep_ones = keep_ones and ones > 0 or zeros == 0
+
+        if keep_ones:
+            low, prefix = split, prefix | (1 << shift)
+        else:
+            high = split
+
+    return numbers[low]
+
+
+def find_ratings(report) -> Tuple[int, int]:
+    """
+    Returns both the oxygen generator and the CO2 scrubber ratings. The report
+    is sorted once and both ratings are searched from the same sorted list.
+    """
+    if not isinstance(report, PackedReport):
+        report = pack_report(report)
+
+    numbers = sorted(report.numbers)
+    return (search_sorted_rating(numbers, report.width, most_common=True),
+            search_sorted_rating(numbers, report.width, most_common=False))
+
+
 if __name__ == '__main__':
-    report = read_report()
-    oxygen_rating = find_oxygen_generator_rating(report)
-    co2_rating = find_co2_generator_rating(report)
+    report = read_packed_report()
+    oxygen_rating, co2_rating = find_ratings(report)
 
     print(oxygen_rating * co2_rating)
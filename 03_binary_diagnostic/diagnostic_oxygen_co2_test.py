@@ -1,5 +1,5 @@
-from diagnostic import convert_to_bits
-from diagnostic_oxygen_co2 import find_oxygen_generator_rating, find_co2_generator_rating
+from diagnostic import convert_to_bits, pack_report
+from diagnostic_oxygen_co2 import find_oxygen_generator_rating, find_co2_generator_rating, find_ratings
 from pytest import fixture
 
 
@@ -17,3 +17,27 @@ def test_find_oxygen_generator_rating(sample_report):
 def test_find_co2_generator_rating(sample_report):
     co2_rating = find_co2_generator_rating(sample_report)
     assert co2_rating == 10
+
+
+def test_find_ratings(sample_report):
+    assert find_ratings(sample_report) == (23, 10)
+    assert find_ratings(pack_report(sample_report)) == (23, 10)
+
+
+def test_find_ratings_matches_filtering():
+    reports = [
+        ['000', '001', '010', '011', '100', '101', '110', '111'],
+        ['1111', '0000', '1000'],
+        ['01', '10'],
+    ]
+    for lines in reports:
+        report = list(map(convert_to_bits, lines))
+        expected = (find_oxygen_generator_rating(report), find_co2_generator_rating(report))
+
+        assert find_ratings(report) == expected
+
+
+def test_find_ratings_never_filters_out_every_number():
+    report = [convert_to_bits('110')]
+
+    assert find_ratings(report) == (6, 6)
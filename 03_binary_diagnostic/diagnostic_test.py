@@ -1,4 +1,7 @@
 from diagnostic import convert_to_bits, read_report, most_common_bit, find_most_common_bits, bits_to_decimal
+from diagnostic import read_packed_report, pack_report, count_ones, invert_bits, PackedBits, PackedReport, read_report_matrix
+import diagnostic
+import pytest
 
 
 def test_converting_string_to_bits():
@@ -33,3 +36,63 @@ def test_bits_to_decimal():
     decimal = bits_to_decimal([1, 0, 1, 1, 0])
 
     assert decimal == 22
+
+
+def test_read_packed_report():
+    report = read_report()
+    packed = read_packed_report()
+
+    assert packed.width == len(report[0])
+    assert packed == pack_report(report)
+
+
+def test_count_ones():
+    packed = pack_report([[1, 1, 0], [1, 0, 0], [1, 0, 1]])
+
+    assert count_ones(packed) == [3, 1, 1]
+
+
+def test_packed_pipeline_matches_bit_lists():
+    data = [[0, 0, 1, 0, 0], [1, 1, 1, 1, 0], [1, 0, 1, 1, 0], [1, 0, 1, 1, 1],
+            [1, 0, 1, 0, 1], [0, 1, 1, 1, 1], [0, 0, 1, 1, 1], [1, 1, 1, 0, 0],
+            [1, 0, 0, 0, 0], [1, 1, 0, 0, 1], [0, 0, 0, 1, 0], [0, 1, 0, 1, 0]]
+    gamma = find_most_common_bits(pack_report(data))
+    epsilon = invert_bits(gamma)
+
+    assert gamma == PackedBits(bits_to_decimal(find_most_common_bits(data)), 5)
+    assert bits_to_decimal(gamma) == 22
+    assert bits_to_decimal(epsilon) == 9
+
+
+def test_packed_ties_use_one():
+    gamma = find_most_common_bits(pack_report([[1, 0], [0, 0]]))
+
+    assert gamma == PackedBits(0b10, 2)
+
+
+def test_find_most_common_bits_from_matrix():
+    pytest.importorskip('numpy')
+    matrix = read_report_matrix()
+
+    assert matrix.shape == (len(read_report()), len(read_report()[0]))
+    assert find_most_common_bits(matrix) == find_most_common_bits(read_report())
+
+
+def test_count_ones_without_numpy(monkeypatch):
+    monkeypatch.setattr(diagnostic, 'np', None)
+    packed = pack_report([[1, 1, 0], [1, 0, 0], [1, 0, 1]])
+
+    assert count_ones(packed) == [3, 1, 1]
+
+
+def test_count_ones_with_uint64_array():
+    np = pytest.importorskip('numpy')
+    packed = pack_report([[1, 1, 0], [1, 0, 0], [1, 0, 1]])
+
+    assert count_ones(PackedReport(np.array(packed.numbers, dtype=np.uint64), 3)) == [3, 1, 1]
+
+
+def test_read_report_matrix_without_numpy(monkeypatch):
+    monkeypatch.setattr(diagnostic, 'np', None)
+
+    assert read_report_matrix() == read_report()
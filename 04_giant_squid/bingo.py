@@ -1,5 +1,12 @@
 from typing import List
+from collections import namedtuple
 import os
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only simulate_bingo needs it
+    np = None
+
 INPUT_FILE = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
@@ -88,6 +95,53 @@ def calculate_score(board: List[List[int]], marked: List[int]) -> int:
     return sum(not_marked) * multiplier
 
 
+# winner and loser are board indices in the same sense as find_winner and find_loser, or None
+BingoSimulation = namedtuple('BingoSimulation', 'winner loser win_times scores')
+
+
+def draw_ranks(drawn_numbers: List[int], size: int):
+    """
+    Returns a lookup table where the value at each number is the index of the
+    draw that first marks it. Numbers that are never drawn get len(drawn_numbers).
+    """
+    ranks = np.full(size, len(drawn_numbers), dtype=np.int64)
+    unique, first_index = np.unique(np.asarray(drawn_numbers, dtype=np.int64), return_index=True)
+    in_range = (unique >= 0) & (unique < size)
+    ranks[unique[in_range]] = first_index[in_range]
+    return ranks
+
+
+def simulate_bingo(boards, drawn_numbers: List[int]) -> BingoSimulation:
+    """
+    Simulates all boards at once with NumPy. Each cell gets the index of the draw
+    that marks it, a row or column is complete at the max of its cells and a board
+    wins at the earliest complete row or column.
+
+    Returns a BingoSimulation with the index of the first and the last winning
+    board, and the win times and scores as arrays with one value per board. Boards
+    that never win get the win time len(drawn_numbers) and the score 0. Like
+    find_winner and find_loser, the first board is chosen in case of a tie, and
+    the winner or loser is None if no board or not every board wins.
+    """
+    tensor = np.asarray(boards, dtype=np.int64)
+    draws = np.asarray(drawn_numbers, dtype=np.int64)
+
+    cell_draws = draw_ranks(drawn_numbers, int(tensor.max()) + 1)[tensor]
+    rows = cell_draws.max(axis=2).min(axis=1)
+    cols = cell_draws.max(axis=1).min(axis=1)
+    win_times = np.minimum(rows, cols)
+
+    unmarked = np.where(cell_draws > win_times[:, None, None], tensor, 0).sum(axis=(1, 2))
+    won = win_times < len(draws)
+    last_called = draws[np.minimum(win_times, len(draws) - 1)] if len(draws) else 0
+    scores = np.where(won, unmarked * last_called, 0)
+
+    winner = int(win_times.argmin()) if won.any() else None
+    loser = int(win_times.argmax()) if won.all() else None
+
+    return BingoSimulation(winner, loser, win_times, scores)
+
+
 if __name__ == '__main__':
     numbers_drawn, boards = read_bingo_input()
 
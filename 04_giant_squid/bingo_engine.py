@@ -0,0 +1,88 @@
+"""
+An incremental bingo engine. Instead of checking every board after each round,
+the engine indexes where each number appears once and keeps counters of the
+marked cells on every row and column, so each draw only touches the cells
+with the drawn number.
+"""
+from collections import defaultdict
+from typing import Dict, Iterator, List, Tuple
+from bingo import read_bingo_input, calculate_score
+
+
+class BingoEngine:
+    def __init__(self, boards: List[List[List[int]]]) -> None:
+        self.boards = boards
+        self.positions: Dict[int, List[Tuple[int, int, int]]] = defaultdict(list)
+
+        for b, board in enumerate(boards):
+            for r, row in enumerate(board):
+                for c, number in enumerate(row):
+                    self.positions[number].append((b, r, c))
+
+        self.row_hits = [[0] * len(board) for board in boards]
+        self.col_hits = [[0] * len(board[0]) for board in boards]
+        self.won = [False] * len(boards)
+        self.drawn = set()
+
+    def draw(self, number: int) -> List[int]:
+        """
+        Marks the number on every board and returns the indices of the boards
+        that won with this number, in board order.
+        """
+        if number in self.drawn:
+            return []
+        self.drawn.add(number)
+
+        winners = []
+        for b, r, c in self.positions.get(number, []):
+            board = self.boards[b]
+            self.row_hits[b][r] += 1
+            self.col_hits[b][c] += 1
+
+            full_row = self.row_hits[b][r] == len(board[r])
+            full_col = self.col_hits[b][c] == len(board)
+            if (full_row or full_col) and not self.won[b]:
+                self.won[b] = True
+                winners.append(b)
+
+        return sorted(winners)
+
+    def play(self, drawn_numbers: List[int]) -> Iterator[Tuple[int, int]]:
+        """
+        Draws the numbers and yields (board index, number of draws) for each
+        board in the order they win.
+        """
+        for round, number in enumerate(drawn_numbers, start=1):
+            for board in self.draw(number):
+                yield board, round
+
+
+def find_winner_and_loser(boards: List[List[List[int]]], drawn_numbers: List[int]) -> tuple:
+    """
+    Finds both the first and the last winning board in a single pass over the
+    drawn numbers. Returns ((winner, marked), (loser, marked)) in the same form
+    as find_winner and find_loser.
+    """
+    wins = list(BingoEngine(boards).play(drawn_numbers))
+
+    if not wins:
+        return (None, drawn_numbers), (None, drawn_numbers)
+
+    first_board, first_round = wins[0]
+    winner = (boards[first_board], drawn_numbers[:first_round])
+
+    if len(wins) < len(boards):
+        return winner, (None, drawn_numbers)
+
+    # when several boards win last on the same draw, the first of them is chosen
+    last_round = wins[-1][1]
+    last_board = next(board for board, round in wins if round == last_round)
+    return winner, (boards[last_board], drawn_numbers[:last_round])
+
+
+if __name__ == '__main__':
+    numbers_drawn, boards = read_bingo_input()
+    (winner, winning_marked), (loser, losing_marked) = find_winner_and_loser(boards, numbers_drawn)
+
+    print(f'Winning score: {calculate_score(winner, winning_marked)}')
+    print(f'Losing score: {calculate_score(loser, losing_marked)}')
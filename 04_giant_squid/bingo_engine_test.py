@@ -0,0 +1,46 @@
+from bingo import find_winner, find_loser
+from bingo_engine import BingoEngine, find_winner_and_loser
+
+
+def test_draw_returns_winning_boards():
+    engine = BingoEngine([
+        [[1, 2], [3, 4]],
+        [[5, 6], [7, 8]]
+    ])
+
+    assert engine.draw(1) == []
+    assert engine.draw(3) == [0]
+    assert engine.draw(3) == []
+    assert engine.draw(2) == []  # board 0 has already won
+
+
+def test_play_yields_boards_in_winning_order():
+    engine = BingoEngine([
+        [[1, 2], [3, 4]],
+        [[5, 6], [7, 8]],
+        [[9, 10], [11, 12]]
+    ])
+
+    wins = list(engine.play([9, 5, 1, 6, 10, 2]))
+    assert wins == [(1, 4), (2, 5), (0, 6)]
+
+
+def test_find_winner_and_loser_matches_slow_versions():
+    boards = [
+        [[1, 2], [3, 4]],
+        [[5, 6], [7, 8]],
+        [[9, 10], [11, 12]]
+    ]
+    for numbers in ([1, 4, 9, 12, 5, 7, 8, 10, 11],
+                    [1, 9, 2, 10, 3, 4, 5, 6, 7, 8, 12, 5, 7, 8, 10, 11],
+                    [1, 5, 9, 3, 7, 11]):
+        winner, loser = find_winner_and_loser(boards, numbers)
+
+        assert winner == find_winner(boards, numbers)
+        assert loser == find_loser(boards, numbers)
+
+
+def test_no_winner():
+    boards = [[[1, 2], [3, 4]]]
+
+    assert find_winner_and_loser(boards, [1, 4]) == ((None, [1, 4]), (None, [1, 4]))
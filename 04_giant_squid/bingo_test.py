@@ -1,4 +1,5 @@
-from bingo import read_bingo_input, check_winner, find_winner, find_loser, calculate_score
+from bingo import read_bingo_input, check_winner, find_winner, find_loser, calculate_score, simulate_bingo, draw_ranks
+import pytest
 
 
 def test_read_bingo_numbers():
@@ -74,3 +75,50 @@ def test_calculate_score():
     marked = [7, 4, 9, 5, 11, 17, 23, 2, 0, 14, 21, 24]
     score = calculate_score(board, marked)
     assert score == 4_512
+
+
+def test_simulate_bingo_matches_winner_and_loser():
+    pytest.importorskip('numpy')
+    boards = [
+        [[1, 2], [3, 4]],
+        [[5, 6], [7, 8]],
+        [[9, 10], [11, 12]]
+    ]
+    numbers = [1, 9, 2, 10, 3, 4, 5, 6, 7, 8, 12, 5, 7, 8, 10, 11]
+    winner, loser, win_times, scores = simulate_bingo(boards, numbers)
+
+    assert win_times.tolist() == [2, 7, 3]
+    assert (winner, loser) == (0, 1)
+    assert (boards[winner], numbers[:win_times[winner] + 1]) == find_winner(boards, numbers)
+    assert (boards[loser], numbers[:win_times[loser] + 1]) == find_loser(boards, numbers)
+
+    for board, win_time, score in zip(boards, win_times, scores):
+        assert score == calculate_score(board, numbers[:win_time + 1])
+
+
+def test_simulate_bingo_with_board_that_never_wins():
+    pytest.importorskip('numpy')
+    boards = [[[1, 2], [3, 4]], [[5, 6], [7, 8]]]
+    winner, loser, win_times, scores = simulate_bingo(boards, [1, 2, 5])
+
+    assert win_times.tolist() == [1, 3]
+    assert scores.tolist() == [14, 0]
+    assert winner == 0
+    assert loser is None
+    assert find_loser(boards, [1, 2, 5])[0] is None
+
+
+def test_simulate_bingo_without_winners():
+    pytest.importorskip('numpy')
+    winner, loser, _, scores = simulate_bingo([[[1, 2], [3, 4]]], [1, 4])
+
+    assert winner is None
+    assert loser is None
+    assert scores.tolist() == [0]
+
+
+def test_draw_ranks_ignores_numbers_outside_the_table():
+    pytest.importorskip('numpy')
+    ranks = draw_ranks([-1, 2, 9], 4)
+
+    assert ranks.tolist() == [3, 3, 1, 3]
@@ -0,0 +1,92 @@
+"""
+Plays the same set of boards against many different draw orders. The rows and
+columns of each board are indexed once and shared with the worker processes,
+which then only need to rank the numbers of each draw sequence.
+
+Usage: python bingo_tournament.py [number of sequences]
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+import random
+import sys
+import time
+from bingo import read_bingo_input, calculate_score
+
+SequenceResult = namedtuple('SequenceResult', 'winner_score loser_score')
+
+# Set in each worker process by _init_worker
+_boards: List[List[List[int]]] = []
+_board_lines: List[List[tuple]] = []
+
+
+def index_board_lines(board: List[List[int]]) -> List[tuple]:
+    """
+    Returns all rows and columns of the board. Diagonals don't count.
+    """
+    return [tuple(row) for row in board] + list(zip(*board))
+
+
+def find_win_time(lines: List[tuple], ranks: dict, never: int) -> int:
+    """
+    A line is complete at the latest draw of its numbers, and a board wins
+    with its earliest complete line.
+    """
+    return min(max(ranks.get(number, never) for number in line) for line in lines)
+
+
+def evaluate_sequence(boards: List[List[List[int]]], board_lines: List[List[tuple]],
+                      drawn_numbers: List[int]) -> SequenceResult:
+    """
+    Returns the scores of the first and the last winning board for the sequence.
+    A score is None if there is no such board.
+    """
+    never = len(drawn_numbers)
+    ranks = {}
+    for i, number in enumerate(drawn_numbers):
+        ranks.setdefault(number, i)
+
+    times = [find_win_time(lines, ranks, never) for lines in board_lines]
+
+    def score(win_time: int) -> Optional[int]:
+        if win_time == never:
+            return None
+        board = boards[times.index(win_time)]  # first board in case of a tie
+        return calculate_score(board, drawn_numbers[:win_time + 1])
+
+    return SequenceResult(score(min(times)), score(max(times)))
+
+
+def _init_worker(boards: List[List[List[int]]]):
+    global _boards, _board_lines
+    _boards = boards
+    _board_lines = [index_board_lines(board) for board in boards]
+
+
+def _evaluate(drawn_numbers: List[int]) -> SequenceResult:
+    return evaluate_sequence(_boards, _board_lines, drawn_numbers)
+
+
+def run_tournament(boards: List[List[List[int]]], sequences: List[List[int]],
+                   workers=None, chunksize=64) -> List[SequenceResult]:
+    """
+    Evaluates every draw sequence against the boards in a process pool and
+    returns the results in the order of the sequences.
+    """
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(boards,)) as executor:
+        return list(executor.map(_evaluate, sequences, chunksize=chunksize))
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    numbers_drawn, boards = read_bingo_input()
+
+    sequences = [random.sample(numbers_drawn, len(numbers_drawn)) for _ in range(count)]
+
+    start = time.perf_counter()
+    results = run_tournament(boards, sequences)
+    elapsed = time.perf_counter() - start
+
+    best = max(result.winner_score or 0 for result in results)
+    print(f'Best winning score: {best}')
+    print(f'{count / elapsed:,.0f} sequences per second')
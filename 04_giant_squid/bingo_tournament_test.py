@@ -0,0 +1,46 @@
+from bingo import find_winner, find_loser, calculate_score
+from bingo_tournament import run_tournament, evaluate_sequence, index_board_lines, SequenceResult
+from pytest import fixture
+
+
+@fixture
+def boards():
+    return [
+        [[1, 2], [3, 4]],
+        [[5, 6], [7, 8]],
+        [[9, 10], [11, 12]]
+    ]
+
+
+def expected_result(boards, numbers):
+    return SequenceResult(calculate_score(*find_winner(boards, numbers)),
+                          calculate_score(*find_loser(boards, numbers)))
+
+
+def test_index_board_lines():
+    assert index_board_lines([[1, 2], [3, 4]]) == [(1, 2), (3, 4), (1, 3), (2, 4)]
+
+
+def test_evaluate_sequence(boards):
+    numbers = [1, 9, 2, 10, 3, 4, 5, 6, 7, 8, 12, 5, 7, 8, 10, 11]
+    lines = [index_board_lines(board) for board in boards]
+
+    assert evaluate_sequence(boards, lines, numbers) == expected_result(boards, numbers)
+
+
+def test_evaluate_sequence_without_all_winners(boards):
+    lines = [index_board_lines(board) for board in boards]
+
+    assert evaluate_sequence(boards, lines, [1, 2]) == SequenceResult(14, None)
+    assert evaluate_sequence(boards, lines, [1, 5]) == SequenceResult(None, None)
+
+
+def test_run_tournament(boards):
+    sequences = [
+        [1, 4, 9, 12, 5, 7, 8, 10, 11, 2, 3, 6],
+        [1, 9, 2, 10, 3, 4, 5, 6, 7, 8, 12, 5, 7, 8, 10, 11],
+        [12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1],
+    ]
+    results = run_tournament(boards, sequences, workers=2, chunksize=1)
+
+    assert results == [expected_result(boards, numbers) for numbers in sequences]
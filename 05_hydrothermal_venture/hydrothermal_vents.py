@@ -1,6 +1,14 @@
 from typing import List, Tuple, Dict
 from collections import namedtuple
+from array import array
 import os
+import re
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, array('H') grids are used without it
+    np = None
+
 INPUT_FILE = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 Point = namedtuple('Point', 'x y')
@@ -20,6 +28,22 @@ def read_coordinate_file(filename=INPUT_FILE) -> List[Line]:
     return list(map(parse_line, lines))
 
 
+def read_coordinate_array(filename=INPUT_FILE):
+    """
+    Reads all coordinates with a single regular expression pass over the file.
+    Returns an (n, 4) int array with columns x1, y1, x2, y2 if NumPy is
+    available, otherwise a list of Lines.
+    """
+    with open(filename) as file:
+        numbers = re.findall(r'-?\d+', file.read())
+
+    if np is not None:
+        return np.array(numbers, dtype=np.int64).reshape(-1, 4)
+
+    values = list(map(int, numbers))
+    return [Line(Point(*values[i:i + 2]), Point(*values[i + 2:i + 4])) for i in range(0, len(values), 4)]
+
+
 def parse_line(input: str) -> Line:
     """
     Takes a string of two points ('1,2 -> 1,3') and returns a Line between the points.
@@ -40,6 +64,10 @@ def filter_straight_lines(lines: List[Line]):
     """
     Only consider horizontal and vertical lines: lines where either x1 = x2 or y1 = y2.
     """
+    if np is not None and isinstance(lines, np.ndarray):
+        x1, y1, x2, y2 = lines.T
+        return lines[(x1 == x2) | (y1 == y2)]
+
     return list(filter(lambda l: l.start.x == l.end.x or l.start.y == l.end.y, lines))
 
 
@@ -58,7 +86,7 @@ def move_towards(point: Point, target: Point) -> Point:
     """
     Creates a new Point which is one step closer to the target point on both x and y axis.
     """
-    def max_one(num): return num / abs(num) if num != 0 else 0
+    def max_one(num): return (num > 0) - (num < 0)
 
     x_step = max_one(target.x - point.x)
     y_step = max_one(target.y - point.y)
@@ -79,21 +107,106 @@ def create_ocean_floor(lines: List[Line]) -> Dict:
     return floor
 
 
-def count_dangerous_points(ocean_floor: dict) -> int:
+def grid_width(lines: List[Line]) -> int:
+    return max(max(line.start.x, line.end.x) for line in lines) + 1
+
+
+def grid_height(lines: List[Line]) -> int:
+    return max(max(line.start.y, line.end.y) for line in lines) + 1
+
+
+def line_to_slice(line: Line, width: int) -> slice:
+    """
+    Returns the slice of a flat row-major grid that covers the line. Horizontal
+    lines step by 1, vertical lines by the grid width and diagonal lines by the
+    width plus or minus one.
+    """
+    dx, dy = line.end.x - line.start.x, line.end.y - line.start.y
+    if dx != 0 and dy != 0 and abs(dx) != abs(dy):
+        raise ValueError(f'Line is not horizontal, vertical or diagonal: {line}')
+
+    start = line.start.y * width + line.start.x
+    end = line.end.y * width + line.end.x
+    step = ((dy > 0) - (dy < 0)) * width + (dx > 0) - (dx < 0)
+
+    if step < 0:
+        start, end, step = end, start, -step
+
+    return slice(start, end + 1, step or 1)
+
+
+def rasterize_ocean_floor(lines: List[Line]):
+    """
+    Creates a flat row-major grid with the number of lines passing each point.
+    Each line is added with a single slice update. The grid is an int64 NumPy
+    array if NumPy is available, otherwise an array('H').
+    """
+    if np is not None and isinstance(lines, np.ndarray):
+        return rasterize_coordinate_array(lines)
+
+    if not lines:
+        return array('H') if np is None else np.zeros(0, dtype=np.int64)
+
+    width = grid_width(lines)
+    size = width * grid_height(lines)
+
+    if np is not None:
+        grid = np.zeros(size, dtype=np.int64)
+        for line in lines:
+            grid[line_to_slice(line, width)] += 1
+        return grid
+
+    grid = array('H', bytes(2 * size))
+    for line in lines:
+        cells = line_to_slice(line, width)
+        grid[cells] = array('H', [count + 1 for count in grid[cells]])
+    return grid
+
+
+def rasterize_coordinate_array(coordinates):
+    """
+    rasterize_ocean_floor for an (n, 4) coordinate array. The flat grid indices of
+    all points of all lines are generated at once and counted with bincount.
+    """
+    if len(coordinates) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    x1, y1, x2, y2 = coordinates.T
+    width = int(max(x1.max(), x2.max())) + 1
+    size = width * (int(max(y1.max(), y2.max())) + 1)
+
+    dx, dy = x2 - x1, y2 - y1
+    if np.any((dx != 0) & (dy != 0) & (np.abs(dx) != np.abs(dy))):
+        raise ValueError('All lines must be horizontal, vertical or diagonal')
+
+    lengths = np.maximum(np.abs(dx), np.abs(dy)) + 1
+    steps = np.sign(dy) * width + np.sign(dx)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+    indices = np.repeat(y1 * width + x1, lengths) + offsets * np.repeat(steps, lengths)
+    return np.bincount(indices, minlength=size).astype(np.int64, copy=False)
+
+
+def count_dangerous_points(ocean_floor) -> int:
     """
     Determines the number of points where at least two lines overlap.
+    The ocean floor can be a dict of Points or a grid from rasterize_ocean_floor.
     """
-    return len([num for num in ocean_floor.values() if num > 1])
+    if isinstance(ocean_floor, dict):
+        return len([num for num in ocean_floor.values() if num > 1])
+    if np is not None and isinstance(ocean_floor, np.ndarray):
+        return int((ocean_floor > 1).sum())
+    return sum(1 for num in ocean_floor if num > 1)
 
 
 if __name__ == '__main__':
-    all_lines = read_coordinate_file()
+    all_lines = read_coordinate_array()
     straight_lines = filter_straight_lines(all_lines)
 
-    floor_challenge_1 = create_ocean_floor(straight_lines)
+    floor_challenge_1 = rasterize_ocean_floor(straight_lines)
     danger_1 = count_dangerous_points(floor_challenge_1)
     print(f'Dangerous positions in challenge 1: {danger_1}')
 
-    floor_challenge_2 = create_ocean_floor(all_lines)
+    floor_challenge_2 = rasterize_ocean_floor(all_lines)
     danger_2 = count_dangerous_points(floor_challenge_2)
     print(f'Dangerous positions in challenge 2: {danger_2}')
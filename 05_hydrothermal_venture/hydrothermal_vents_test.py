@@ -1,5 +1,8 @@
 from hydrothermal_vents import parse_coordinate, count_dangerous_points, filter_straight_lines, interpolate_line, create_ocean_floor, parse_line, read_coordinate_file, move_towards, Point
+from hydrothermal_vents import line_to_slice, rasterize_ocean_floor, read_coordinate_array
+import hydrothermal_vents
 import os
+import pytest
 
 
 def test_parse_coordinate():
@@ -63,3 +66,65 @@ def test_aoc_test_input():
 
     floor = create_ocean_floor(straight)
     assert count_dangerous_points(floor) == 5
+
+
+def test_line_to_slice():
+    width = 10
+
+    assert line_to_slice(parse_line('2,1 -> 5,1'), width) == slice(12, 16, 1)
+    assert line_to_slice(parse_line('3,4 -> 3,1'), width) == slice(13, 44, 10)
+    assert line_to_slice(parse_line('8,0 -> 0,8'), width) == slice(8, 81, 9)
+    assert line_to_slice(parse_line('4,4 -> 4,4'), width) == slice(44, 45, 1)
+
+    with pytest.raises(ValueError):
+        line_to_slice(parse_line('0,0 -> 2,1'), width)
+
+
+def test_rasterize_matches_ocean_floor():
+    file = os.path.join(os.path.dirname(__file__), 'test_input.txt')
+    lines = read_coordinate_file(file)
+
+    straight = filter_straight_lines(lines)
+    assert count_dangerous_points(rasterize_ocean_floor(straight)) == 5
+    assert count_dangerous_points(rasterize_ocean_floor(lines)) == 12
+    assert count_dangerous_points(create_ocean_floor(lines)) == 12
+
+
+def test_rasterize_without_numpy(monkeypatch):
+    monkeypatch.setattr(hydrothermal_vents, 'np', None)
+    file = os.path.join(os.path.dirname(__file__), 'test_input.txt')
+
+    grid = rasterize_ocean_floor(read_coordinate_file(file))
+    assert grid.typecode == 'H'
+    assert count_dangerous_points(grid) == 12
+
+
+def test_coordinate_array_pipeline():
+    pytest.importorskip('numpy')
+    file = os.path.join(os.path.dirname(__file__), 'test_input.txt')
+    coordinates = read_coordinate_array(file)
+
+    assert coordinates.shape == (10, 4)
+    assert coordinates[0].tolist() == [0, 9, 5, 9]
+    assert coordinates[-1].tolist() == [5, 5, 8, 2]
+    assert len(filter_straight_lines(coordinates)) == len(filter_straight_lines(read_coordinate_file(file)))
+    assert count_dangerous_points(rasterize_ocean_floor(filter_straight_lines(coordinates))) == 5
+    assert count_dangerous_points(rasterize_ocean_floor(coordinates)) == 12
+    assert rasterize_ocean_floor(coordinates).tolist() == rasterize_ocean_floor(read_coordinate_file(file)).tolist()
+
+
+def test_read_coordinate_array_without_numpy(monkeypatch):
+    monkeypatch.setattr(hydrothermal_vents, 'np', None)
+    file = os.path.join(os.path.dirname(__file__), 'test_input.txt')
+
+    assert read_coordinate_array(file) == read_coordinate_file(file)
+
+
+def test_rasterized_grids_use_int64():
+    np = pytest.importorskip('numpy')
+    line = parse_line('0,0 -> 2,0')
+
+    assert rasterize_ocean_floor([]).dtype == np.int64
+    assert rasterize_ocean_floor([line]).dtype == np.int64
+    assert rasterize_ocean_floor(np.array([[0, 0, 2, 0]])).dtype == np.int64
+    assert rasterize_ocean_floor([line] * 70_000)[0] == 70_000
@@ -0,0 +1,148 @@
+"""
+Counts the points where at least two vent lines overlap without visiting every
+point of every line. Lines are grouped into four families (horizontal, vertical
+and the two diagonals) and each family is bucketed by the value that stays
+constant along its lines. Overlaps within a bucket are 1-dimensional interval
+overlaps, and crossings between families are solved from the bucket keys.
+"""
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, namedtuple
+from typing import Dict, List, Set, Tuple
+from hydrothermal_vents import read_coordinate_file, filter_straight_lines, Line, Point
+
+# key: the coordinate that is constant along the line, position: where on the line a point is,
+# point: the Point at the given key and position
+Family = namedtuple('Family', 'key position point')
+
+HORIZONTAL = Family(lambda p: p.y, lambda p: p.x, lambda k, t: Point(t, k))
+VERTICAL = Family(lambda p: p.x, lambda p: p.y, lambda k, t: Point(k, t))
+DIAGONAL_UP = Family(lambda p: p.x - p.y, lambda p: p.x, lambda k, t: Point(t, t - k))
+DIAGONAL_DOWN = Family(lambda p: p.x + p.y, lambda p: p.x, lambda k, t: Point(t, k - t))
+
+FAMILIES = (HORIZONTAL, VERTICAL, DIAGONAL_UP, DIAGONAL_DOWN)
+
+# Sorted, disjoint, inclusive intervals as separate lists of starts and ends
+Intervals = Tuple[List[int], List[int]]
+
+
+def classify_line(line: Line) -> Family:
+    dx, dy = line.end.x - line.start.x, line.end.y - line.start.y
+
+    if dy == 0:
+        return HORIZONTAL
+    if dx == 0:
+        return VERTICAL
+    if dx == dy:
+        return DIAGONAL_UP
+    if dx == -dy:
+        return DIAGONAL_DOWN
+    raise ValueError(f'Line is not horizontal, vertical or diagonal: {line}')
+
+
+def sweep_intervals(intervals: List[Tuple[int, int]], min_coverage: int) -> Intervals:
+    """
+    Returns the parts of the number line covered by at least min_coverage of the
+    given inclusive intervals.
+    """
+    events = sorted([(start, 1) for start, _ in intervals] + [(end + 1, -1) for _, end in intervals])
+    starts, ends = [], []
+    coverage = 0
+
+    for position, change in events:
+        before = coverage
+        coverage += change
+        if before < min_coverage <= coverage:
+            if ends and ends[-1] == position - 1:
+                ends.pop()  # continues the previous interval
+            else:
+                starts.append(position)
+        elif coverage < min_coverage <= before:
+            ends.append(position - 1)
+
+    return starts, ends
+
+
+def contains(intervals: Intervals, position: int) -> bool:
+    starts, ends = intervals
+    i = bisect_right(starts, position) - 1
+    return i >= 0 and position <= ends[i]
+
+
+def bucket_lines(lines: List[Line]) -> Dict[Family, Dict[int, List[Tuple[int, int]]]]:
+    """
+    Groups the lines by family and key into lists of (start, end) positions.
+    """
+    buckets = {family: defaultdict(list) for family in FAMILIES}
+
+    for line in lines:
+        family = classify_line(line)
+        positions = sorted((family.position(line.start), family.position(line.end)))
+        buckets[family][family.key(line.start)].append(tuple(positions))
+
+    return buckets
+
+
+def find_crossings(first: Family, covered_first: Dict[int, Intervals],
+                   second: Family, covered_second: Dict[int, Intervals]) -> Set[Point]:
+    """
+    Finds the lattice points covered by lines of both families. Along a line of the
+    first family, the key of the second family changes linearly, so only the keys
+    of the second family within the range of the line need to be checked.
+    """
+    crossings = set()
+    keys = sorted(covered_second)
+
+    for key, (starts, ends) in covered_first.items():
+        for start, end in zip(starts, ends):
+            key_at_start = second.key(first.point(key, start))
+            rate = second.key(first.point(key, start + 1)) - key_at_start
+            key_at_end = key_at_start + rate * (end - start)
+            low, high = min(key_at_start, key_at_end), max(key_at_start, key_at_end)
+
+            for other_key in keys[bisect_left(keys, low):bisect_right(keys, high)]:
+                steps, remainder = divmod(other_key - key_at_start, rate)
+                if remainder:
+                    continue  # the diagonals only meet on every other key
+                point = first.point(key, start + steps)
+                if contains(covered_second[other_key], second.position(point)):
+                    crossings.add(point)
+
+    return crossings
+
+
+def count_overlapping_points(lines: List[Line]) -> int:
+    """
+    Returns the same result as count_dangerous_points(create_ocean_floor(lines)).
+
+    The points covered twice within a family are summed from interval lengths. The
+    points where families cross are added if no family already covers them twice,
+    and points covered twice in several families are only counted once.
+    """
+    buckets = bucket_lines(lines)
+    covered = {f: {k: sweep_intervals(i, 1) for k, i in buckets[f].items()} for f in FAMILIES}
+    doubled = {f: {k: sweep_intervals(i, 2) for k, i in buckets[f].items()} for f in FAMILIES}
+
+    total = sum(end - start + 1
+                for family in FAMILIES
+                for starts, ends in doubled[family].values()
+                for start, end in zip(starts, ends))
+
+    crossings = set()
+    for i, first in enumerate(FAMILIES):
+        for second in FAMILIES[i + 1:]:
+            crossings |= find_crossings(first, covered[first], second, covered[second])
+
+    for point in crossings:
+        doubled_in = sum(1 for family in FAMILIES
+                         if family.key(point) in doubled[family]
+                         and contains(doubled[family][family.key(point)], family.position(point)))
+        total += 1 if doubled_in == 0 else 1 - doubled_in
+
+    return total
+
+
+if __name__ == '__main__':
+    all_lines = read_coordinate_file()
+
+    print(f'Dangerous positions in challenge 1: {count_overlapping_points(filter_straight_lines(all_lines))}')
+    print(f'Dangerous positions in challenge 2: {count_overlapping_points(all_lines)}')
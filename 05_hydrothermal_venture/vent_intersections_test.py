@@ -0,0 +1,45 @@
+from hydrothermal_vents import read_coordinate_file, filter_straight_lines, create_ocean_floor, count_dangerous_points
+from hydrothermal_vents import Line, Point
+from vent_intersections import count_overlapping_points, sweep_intervals, contains
+import os
+import random
+
+
+def random_line(rng: random.Random, size: int) -> Line:
+    start = Point(rng.randrange(size), rng.randrange(size))
+    kind = rng.choice('hvd')
+    length = rng.randrange(-size // 2, size // 2)
+
+    if kind == 'h':
+        end = Point(start.x + length, start.y)
+    elif kind == 'v':
+        end = Point(start.x, start.y + length)
+    else:
+        end = Point(start.x + length, start.y + rng.choice((-1, 1)) * length)
+    return Line(start, end)
+
+
+def test_sweep_intervals():
+    intervals = [(0, 4), (2, 6), (5, 8), (10, 10), (10, 12)]
+
+    assert sweep_intervals(intervals, 1) == ([0, 10], [8, 12])
+    assert sweep_intervals(intervals, 2) == ([2, 10], [6, 10])
+    assert contains(([2, 10], [6, 10]), 6)
+    assert not contains(([2, 10], [6, 10]), 7)
+
+
+def test_aoc_test_input():
+    file = os.path.join(os.path.dirname(__file__), 'test_input.txt')
+    lines = read_coordinate_file(file)
+
+    assert count_overlapping_points(filter_straight_lines(lines)) == 5
+    assert count_overlapping_points(lines) == 12
+
+
+def test_matches_ocean_floor_with_random_lines():
+    rng = random.Random(2021)
+
+    for _ in range(200):
+        lines = [random_line(rng, 20) for _ in range(rng.randrange(1, 15))]
+
+        assert count_overlapping_points(lines) == count_dangerous_points(create_ocean_floor(lines))
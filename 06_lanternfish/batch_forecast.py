@@ -0,0 +1,81 @@
+"""
+Forecasts many independent schools of lanternfish at once. The populations are
+stacked into a (k, 9) array, one row per school.
+"""
+from typing import Iterator, List
+from lanternfish import Population
+from population_projector import PopulationProjector, Matrix, apply
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the schools are advanced one by one without it
+    np = None
+
+
+def stack_populations(populations: List[List[int]], dtype=object):
+    """
+    Stacks age histograms from read_population_ages into a (k, 9) array. The
+    default object dtype holds exact Python ints. A fixed width dtype such as
+    int64 is faster, but the forecasts raise OverflowError once the counts no
+    longer fit. Without NumPy the populations are copied into a list of lists.
+    """
+    if np is None:
+        return [list(population) for population in populations]
+    return np.array(populations, dtype=dtype).reshape(-1, 9)
+
+
+def check_overflow(populations, matrix: Matrix):
+    """
+    Raises OverflowError if any school would outgrow the integer dtype of the
+    batch. A column sum of the matrix is the number of descendants of a single
+    fish of that age, so the exact totals are cheap to compute in Python ints.
+    """
+    if not np.issubdtype(populations.dtype, np.integer):
+        return
+
+    limit = int(np.iinfo(populations.dtype).max)
+    descendants = [sum(row[age] for row in matrix) for age in range(9)]
+
+    for population in populations.tolist():
+        if sum(count * fish for count, fish in zip(descendants, population)) > limit:
+            raise OverflowError(f'The populations do not fit in {populations.dtype}, use dtype=object')
+
+
+def advance_batch(populations, days: int, projector: PopulationProjector = None):
+    """
+    Advances all populations by the given number of days by applying one
+    transition matrix power to the whole batch. Returns a new batch.
+    """
+    projector = projector or PopulationProjector()
+    matrix = projector.matrix_for(days)
+
+    if np is None:
+        return [apply(matrix, population) for population in populations]
+
+    populations = populations if isinstance(populations, np.ndarray) else stack_populations(populations)
+    check_overflow(populations, matrix)
+    return populations @ np.array(matrix, dtype=populations.dtype).T
+
+
+def daily_totals(populations, days: int) -> Iterator:
+    """
+    Yields the total population of every school for each of the following days,
+    without storing the earlier days.
+    """
+    if np is None:
+        schools = [Population(population) for population in populations]
+        for _ in range(days):
+            for school in schools:
+                school.advance()
+            yield [school.total() for school in schools]
+        return
+
+    populations = np.array(populations, dtype=getattr(populations, 'dtype', object))
+    check_overflow(populations, PopulationProjector().matrix_for(days))  # the totals only grow
+
+    for _ in range(days):
+        breeding = populations[:, 0].copy()
+        populations[:, :-1] = populations[:, 1:]
+        populations[:, 6] += breeding
+        populations[:, 8] = breeding
+        yield populations.sum(axis=1)
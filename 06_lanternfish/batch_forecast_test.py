@@ -0,0 +1,77 @@
+from lanternfish import advance_population_by_days
+from batch_forecast import stack_populations, advance_batch, daily_totals
+import batch_forecast
+import pytest
+from pytest import fixture
+
+
+@fixture
+def schools():
+    return [
+        [0, 1, 1, 2, 1, 0, 0, 0, 0],
+        [1, 2, 3, 4, 0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0, 0, 0, 5]
+    ]
+
+
+def expected_after(schools, days):
+    return [advance_population_by_days(list(school), days) for school in schools]
+
+
+def test_advance_batch(schools):
+    pytest.importorskip('numpy')
+    batch = stack_populations(schools)
+
+    assert batch.shape == (3, 9)
+    assert advance_batch(batch, 80).tolist() == expected_after(schools, 80)
+    assert advance_batch(batch, 600).tolist() == expected_after(schools, 600)
+    assert advance_batch(schools, 600).tolist() == expected_after(schools, 600)
+
+
+def test_daily_totals(schools):
+    pytest.importorskip('numpy')
+    totals = [list(day) for day in daily_totals(stack_populations(schools), 20)]
+
+    assert len(totals) == 20
+    for day, day_totals in enumerate(totals, start=1):
+        assert day_totals == [sum(school) for school in expected_after(schools, day)]
+
+
+def test_without_numpy(schools, monkeypatch):
+    monkeypatch.setattr(batch_forecast, 'np', None)
+
+    assert advance_batch(schools, 80) == expected_after(schools, 80)
+    assert list(daily_totals(schools, 3))[-1] == [sum(school) for school in expected_after(schools, 3)]
+
+
+def test_advance_batch_with_negative_days(schools):
+    with pytest.raises(ValueError):
+        advance_batch(schools, -1)
+
+
+def test_daily_totals_over_long_horizon(schools):
+    pytest.importorskip('numpy')
+    *_, last = daily_totals(stack_populations(schools), 600)
+
+    assert list(last) == [sum(school) for school in expected_after(schools, 600)]
+
+
+def test_fixed_width_dtype_raises_instead_of_overflowing(schools):
+    np = pytest.importorskip('numpy')
+    batch = stack_populations(schools, dtype=np.int64)
+
+    assert advance_batch(batch, 256).tolist() == expected_after(schools, 256)
+
+    with pytest.raises(OverflowError):
+        advance_batch(batch, 600)
+
+    with pytest.raises(OverflowError):
+        next(daily_totals(batch, 600))
+
+
+def test_stack_populations_without_numpy(schools, monkeypatch):
+    monkeypatch.setattr(batch_forecast, 'np', None)
+    stacked = stack_populations(schools)
+
+    assert stacked == schools
+    assert stacked[0] is not schools[0]
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 import os
 INPUT_FILE = os.path.join(os.path.dirname(__file__), 'input.txt')
 
@@ -31,11 +31,55 @@ def advance_population_by_days(population: List[int], days: int) -> List[int]:
     return population
 
 
+class Population:
+    """
+    Lanternfish age groups in a fixed ring buffer of nine slots. Instead of
+    shifting the groups every day, the index of the age 0 slot moves forward:
+    the fish breeding today stay in their slot, which becomes the age 8 slot of
+    their offspring.
+    """
+
+    __slots__ = ('_counts', '_head', '_total')
+
+    def __init__(self, counts: List[int]) -> None:
+        if len(counts) != 9:
+            raise ValueError(f'Expected 9 age groups, got {len(counts)}')
+        self._counts = list(counts)
+        self._head = 0
+        self._total = sum(counts)
+
+    def advance(self, days: int = 1):
+        for _ in range(days):
+            breeding = self._counts[self._head]
+            self._head = (self._head + 1) % 9
+            self._counts[(self._head + 6) % 9] += breeding
+            self._total += breeding
+
+    def total(self) -> int:
+        return self._total
+
+    def snapshot(self) -> Tuple[Tuple[int, ...], int, int]:
+        return tuple(self._counts), self._head, self._total
+
+    def restore(self, snapshot: Tuple[Tuple[int, ...], int, int]):
+        counts, self._head, self._total = snapshot
+        self._counts = list(counts)
+
+    def __getitem__(self, age: int) -> int:
+        return self._counts[(self._head + age) % 9]
+
+    def to_list(self) -> List[int]:
+        """
+        Returns the age groups in the same form as read_population_ages.
+        """
+        return [self[age] for age in range(9)]
+
+
 if __name__ == '__main__':
-    population = read_population_ages()
-    population = advance_population_by_days(population, 80)
+    population = Population(read_population_ages())
+    population.advance(80)
 
-    print(f'Population after 80 days: {sum(population)}')
+    print(f'Population after 80 days: {population.total()}')
 
-    population = advance_population_by_days(population, 256 - 80)
-    print(f'Population after 256 days: {sum(population)}')
+    population.advance(256 - 80)
+    print(f'Population after 256 days: {population.total()}')
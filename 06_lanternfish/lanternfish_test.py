@@ -1,4 +1,5 @@
-from lanternfish import read_population_ages, advance_population_by_days
+from lanternfish import read_population_ages, advance_population_by_days, Population
+import pytest
 
 
 def test_read_population_ages():
@@ -25,3 +26,36 @@ def test_advance_population_by_multiple_days():
     advance_population_by_days(population, 2)
 
     assert population == [3, 4, 0, 0, 0, 1, 2, 1, 2]
+
+
+def test_population_matches_list_version():
+    counts = [1, 2, 3, 4, 0, 0, 0, 0, 0]
+    population = Population(counts)
+
+    for day in range(1, 30):
+        population.advance()
+        expected = advance_population_by_days(list(counts), day)
+
+        assert population.to_list() == expected
+        assert population.total() == sum(expected)
+
+    assert counts == [1, 2, 3, 4, 0, 0, 0, 0, 0]
+
+
+def test_population_snapshot_and_restore():
+    population = Population([0, 1, 1, 2, 1, 0, 0, 0, 0])
+    population.advance(3)
+    snapshot = population.snapshot()
+
+    population.advance(77)
+    assert population.total() == 5_934
+
+    population.restore(snapshot)
+    assert population.to_list() == advance_population_by_days([0, 1, 1, 2, 1, 0, 0, 0, 0], 3)
+    population.advance(77)
+    assert population.total() == 5_934
+
+
+def test_population_requires_nine_age_groups():
+    with pytest.raises(ValueError):
+        Population([1, 2, 3])
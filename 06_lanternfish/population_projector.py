@@ -0,0 +1,105 @@
+"""
+Projects the lanternfish population far into the future. One day is a linear
+transform of the nine age groups, so n days is the n-th power of the 9x9
+transition matrix, which is computed by repeated squaring.
+
+The population grows exponentially: after 10^12 days the exact count has tens
+of billions of digits. For such horizons the projector can work modulo a given
+number, for example to find the last digits of the count.
+"""
+from typing import Dict, List, Optional
+from lanternfish import read_population_ages
+
+Matrix = List[List[int]]
+
+AGES = 9
+
+
+def transition_matrix() -> Matrix:
+    """
+    new[age] = sum(matrix[age][old_age] * old[old_age]). Each fish moves one age
+    group down, and the fish at age 0 reset to 6 and give birth to fish at age 8.
+    """
+    matrix = [[0] * AGES for _ in range(AGES)]
+    for age in range(AGES - 1):
+        matrix[age][age + 1] = 1
+    matrix[6][0] = 1
+    matrix[8][0] = 1
+    return matrix
+
+
+def multiply(a: Matrix, b: Matrix, modulus: Optional[int] = None) -> Matrix:
+    product = [[sum(a[i][k] * b[k][j] for k in range(AGES)) for j in range(AGES)] for i in range(AGES)]
+    return product if modulus is None else [[value % modulus for value in row] for row in product]
+
+
+def apply(matrix: Matrix, population: List[int], modulus: Optional[int] = None) -> List[int]:
+    result = [sum(matrix[i][k] * population[k] for k in range(AGES)) for i in range(AGES)]
+    return result if modulus is None else [value % modulus for value in result]
+
+
+class PopulationProjector:
+    """
+    Caches the powers of two of the transition matrix, so that projecting any
+    number of days only costs one matrix-vector product per set bit of the days.
+    With a modulus all counts are given modulo it.
+    """
+
+    def __init__(self, modulus: Optional[int] = None) -> None:
+        self.modulus = modulus
+        self.powers: List[Matrix] = [transition_matrix()]
+        self.cache: Dict[int, Matrix] = {}
+
+    def power_of_two(self, exponent: int) -> Matrix:
+        while len(self.powers) <= exponent:
+            self.powers.append(multiply(self.powers[-1], self.powers[-1], self.modulus))
+        return self.powers[exponent]
+
+    def project(self, population: List[int], days: int) -> List[int]:
+        """
+        Returns a new population advanced by the given number of days. The
+        given population is not modified.
+        """
+        if days < 0:
+            raise ValueError(f'Days must not be negative, got {days}')
+
+        population = list(population)
+        exponent = 0
+        while days:
+            if days & 1:
+                population = apply(self.power_of_two(exponent), population, self.modulus)
+            days >>= 1
+            exponent += 1
+        return population
+
+    def matrix_for(self, days: int) -> Matrix:
+        """
+        Returns the full transition matrix for the given number of days. The
+        results are cached for applying the same horizon to many populations.
+        """
+        if days < 0:
+            raise ValueError(f'Days must not be negative, got {days}')
+
+        if days not in self.cache:
+            result = [[int(i == j) for j in range(AGES)] for i in range(AGES)]
+            exponent = 0
+            remaining = days
+            while remaining:
+                if remaining & 1:
+                    result = multiply(self.power_of_two(exponent), result, self.modulus)
+                remaining >>= 1
+                exponent += 1
+            self.cache[days] = result
+        return self.cache[days]
+
+
+if __name__ == '__main__':
+    population = read_population_ages()
+    projector = PopulationProjector()
+
+    for days in (80, 256, 10_000):
+        print(f'Population after {days} days: {sum(projector.project(population, days))}')
+
+    last_digits = PopulationProjector(modulus=10 ** 12)
+    total = sum(last_digits.project(population, 10 ** 12)) % 10 ** 12
+    print(f'Last 12 digits of the population after 10^12 days: {total:012}')
@@ -0,0 +1,57 @@
+from lanternfish import advance_population_by_days
+from population_projector import PopulationProjector, transition_matrix, apply
+import pytest
+from pytest import fixture
+
+
+@fixture
+def sample_population():
+    # 3,4,3,1,2 from the puzzle description
+    return [0, 1, 1, 2, 1, 0, 0, 0, 0]
+
+
+def test_transition_matrix_advances_one_day():
+    population = [1, 2, 3, 4, 0, 0, 0, 0, 0]
+
+    assert apply(transition_matrix(), population) == [2, 3, 4, 0, 0, 0, 1, 0, 1]
+
+
+def test_project_matches_iterative_version(sample_population):
+    projector = PopulationProjector()
+
+    for days in (0, 1, 18, 80, 256):
+        expected = advance_population_by_days(list(sample_population), days)
+        assert projector.project(sample_population, days) == expected
+
+    assert sum(projector.project(sample_population, 80)) == 5_934
+    assert sum(projector.project(sample_population, 256)) == 26_984_457_539
+
+
+def test_project_does_not_modify_population(sample_population):
+    original = list(sample_population)
+    PopulationProjector().project(sample_population, 10)
+
+    assert sample_population == original
+
+
+def test_matrix_for_is_cached(sample_population):
+    projector = PopulationProjector()
+    matrix = projector.matrix_for(256)
+
+    assert projector.matrix_for(256) is matrix
+    assert apply(matrix, sample_population) == projector.project(sample_population, 256)
+
+
+def test_negative_days():
+    with pytest.raises(ValueError):
+        PopulationProjector().project([0] * 9, -1)
+
+    with pytest.raises(ValueError):
+        PopulationProjector().matrix_for(-1)
+
+
+def test_project_with_modulus(sample_population):
+    modulus = 1_000_007
+    exact = PopulationProjector().project(sample_population, 500)
+
+    assert PopulationProjector(modulus).project(sample_population, 500) == [count % modulus for count in exact]
@@ -1,5 +1,11 @@
-from typing import List
+from typing import Callable, List, Tuple
 import os
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, cost curves are returned as lists without it
+    np = None
 
 INPUT_FILE = os.path.join(os.path.dirname(__file__), 'input.txt')
 
@@ -31,6 +37,13 @@ def calculate_total_non_linear_cost_to(positions: List[int], target: int) -> int
     return sum(_get_non_linear_cost(distance) for distance in distances)
 
 
+def _get_linear_cost(distance: int) -> int:
+    """
+    Each change of 1 step in horizontal position of a single crab costs 1 fuel.
+    """
+    return distance
+
+
 def _get_non_linear_cost(distance: int) -> int:
     """
     Each change of 1 step in horizontal position costs 1 more unit of
@@ -40,23 +53,122 @@ def _get_non_linear_cost(distance: int) -> int:
     return distance * (distance + 1) // 2
 
 
+def select(numbers: List[int], k: int) -> int:
+    """
+    Returns the k-th smallest number (starting from 0) in linear average time
+    without sorting all of the numbers.
+    """
+    while True:
+        pivot = random.choice(numbers)
+        smaller = [n for n in numbers if n < pivot]
+        if k < len(smaller):
+            numbers = smaller
+            continue
+
+        equal = sum(1 for n in numbers if n == pivot)
+        if k < len(smaller) + equal:
+            return pivot
+
+        k -= len(smaller) + equal
+        numbers = [n for n in numbers if n > pivot]
+
+
+def find_linear_optimum(positions: List[int]) -> Tuple[int, int]:
+    """
+    The sum of distances is smallest at the median. With an even number of crabs
+    every position between the two middle ones is as good, and the lower one is
+    chosen. Returns (position, cost).
+    """
+    median = select(positions, (len(positions) - 1) // 2)
+    return median, calculate_total_linear_cost_to(positions, median)
+
+
+def find_non_linear_optimum(positions: List[int]) -> Tuple[int, int]:
+    """
+    The triangular cost is smallest within half a step from the mean, so only the
+    integers around the mean need to be checked. Returns (position, cost).
+    """
+    total, count = sum(positions), len(positions)
+    low = (2 * total - count) // (2 * count)  # floor(mean - 1/2)
+    high = -((-2 * total - count) // (2 * count))  # ceil(mean + 1/2)
+
+    costs = [(calculate_total_non_linear_cost_to(positions, target), target) for target in range(low, high + 1)]
+    cost, target = min(costs)
+    return target, cost
+
+
+def find_convex_optimum(positions: List[int], cost: Callable[[int], int] = _get_linear_cost) -> Tuple[int, int]:
+    """
+    Finds the cheapest target for any per-distance cost that is convex and non-decreasing,
+    such as _get_linear_cost and _get_non_linear_cost. The total cost is then convex in
+    the target, so the search can halve the range by comparing two neighbouring targets.
+    Returns the lowest of the optimal targets and its cost.
+    """
+    def total_cost(target): return sum(cost(abs(position - target)) for position in positions)
+
+    low, high = min(positions), max(positions)
+    while low < high:
+        middle = (low + high) // 2
+        if total_cost(middle) <= total_cost(middle + 1):
+            high = middle
+        else:
+            low = middle + 1
+
+    return low, total_cost(low)
+
+
+def calculate_cost_curves(positions: List[int]) -> tuple:
+    """
+    Returns the total linear and non-linear costs to every target from 0 to
+    max(positions) as two sequences indexed by the target.
+
+    With the counts and position sums of the crabs left of each target, the
+    linear cost is t * left - left_sum + (right_sum - t * right). The non-linear
+    cost d * (d + 1) / 2 sums to (sum of d^2 + sum of d) / 2, where the sum of
+    squared distances n * t^2 - 2 * t * sum + sum of squares needs no split.
+    Uses NumPy int64 arrays if NumPy is available, otherwise lists.
+    """
+    count, total = len(positions), sum(positions)
+    squares = sum(p * p for p in positions)
+    size = max(positions) + 1
+
+    if np is not None:
+        histogram = np.bincount(positions, minlength=size).astype(np.int64)
+        targets = np.arange(size, dtype=np.int64)
+        left = np.cumsum(histogram)
+        left_sum = np.cumsum(histogram * targets)
+    else:
+        histogram = [0] * size
+        for position in positions:
+            histogram[position] += 1
+        targets = range(size)
+        left, left_sum = [], []
+        running_count = running_sum = 0
+        for target in targets:
+            running_count += histogram[target]
+            running_sum += histogram[target] * target
+            left.append(running_count)
+            left_sum.append(running_sum)
+
+    def linear(t, left_count, s): return t * left_count - s + (total - s) - t * (count - left_count)
+    def non_linear(t, lin): return (count * t * t - 2 * t * total + squares + lin) // 2
+
+    if np is not None:
+        linear_costs = linear(targets, left, left_sum)
+        return linear_costs, non_linear(targets, linear_costs)
+
+    linear_costs = [linear(t, left_count, s) for t, left_count, s in zip(targets, left, left_sum)]
+    return linear_costs, [non_linear(t, lin) for t, lin in zip(targets, linear_costs)]
+
+
 if __name__ == '__main__':
     crabs = read_crab_coordinates()
 
-    costs_per_guess_1 = [calculate_total_linear_cost_to(
-        crabs, guess) for guess in range(0, max(crabs))]
-
     # Part 1: Crab submarines have limited fuel, so you need to find a way to make all of their
     # horizontal positions match while requiring them to spend as little fuel as possible.
-    min_fuel_1 = min(costs_per_guess_1)
-    best_guess_1 = costs_per_guess_1.index(min_fuel_1)
-
+    best_guess_1, min_fuel_1 = find_linear_optimum(crabs)
     print(f'First part: Moce crabs to {best_guess_1} with cost: {min_fuel_1}')
 
     # Part 2: As it turns out, crab submarine engines don't burn fuel at a constant rate.
-    costs_per_guess_2 = [calculate_total_non_linear_cost_to(
-        crabs, guess) for guess in range(0, max(crabs))]
-
-    min_fuel_2 = min(costs_per_guess_2)
-    best_guess_2 = costs_per_guess_2.index(min_fuel_2)
+    best_guess_2, min_fuel_2 = find_non_linear_optimum(crabs)
     print(f'Second part: Moce crabs to {best_guess_2} with cost: {min_fuel_2}')
@@ -1,4 +1,9 @@
 from horizontal_positions import calculate_total_linear_cost_to, calculate_total_non_linear_cost_to, read_crab_coordinates
+from horizontal_positions import select, find_linear_optimum, find_non_linear_optimum, find_convex_optimum
+from horizontal_positions import calculate_cost_curves
+from horizontal_positions import _get_linear_cost, _get_non_linear_cost
+import horizontal_positions
+import random
 from pytest import fixture
 
 
@@ -22,3 +27,76 @@ def test_calculating_linear_cost_to_correct_answer(advent_of_code_example):
 def test_calculating_non_linear_cost_to_correct_answer(advent_of_code_example):
     assert calculate_total_non_linear_cost_to(
         advent_of_code_example, 5) == 168
+
+
+def test_select():
+    numbers = [5, 1, 4, 1, 3, 9, 2]
+
+    assert [select(numbers, k) for k in range(len(numbers))] == sorted(numbers)
+
+
+def test_find_linear_optimum(advent_of_code_example):
+    assert find_linear_optimum(advent_of_code_example) == (2, 37)
+
+
+def test_find_non_linear_optimum(advent_of_code_example):
+    assert find_non_linear_optimum(advent_of_code_example) == (5, 168)
+
+
+def test_non_linear_optimum_above_the_mean():
+    for crabs in ([5, 6, 7, 0], [54, 2, 75, 87, 13, 54], [823, 589, 8, 802]):
+        costs = [calculate_total_non_linear_cost_to(crabs, t) for t in range(max(crabs) + 1)]
+
+        assert find_non_linear_optimum(crabs) == (costs.index(min(costs)), min(costs))
+
+    assert find_non_linear_optimum([5, 6, 7, 0]) == (5, 19)
+
+
+def test_optimums_match_brute_force():
+    rng = random.Random(7)
+
+    for _ in range(100):
+        crabs = [rng.randrange(50) for _ in range(rng.randrange(1, 20))]
+        linear = [calculate_total_linear_cost_to(crabs, t) for t in range(max(crabs) + 1)]
+        non_linear = [calculate_total_non_linear_cost_to(crabs, t) for t in range(max(crabs) + 1)]
+
+        assert find_linear_optimum(crabs) == (linear.index(min(linear)), min(linear))
+        assert find_non_linear_optimum(crabs) == (non_linear.index(min(non_linear)), min(non_linear))
+
+
+def test_calculate_cost_curves(advent_of_code_example):
+    linear, non_linear = calculate_cost_curves(advent_of_code_example)
+    targets = range(max(advent_of_code_example) + 1)
+
+    assert list(linear) == [calculate_total_linear_cost_to(advent_of_code_example, t) for t in targets]
+    assert list(non_linear) == [calculate_total_non_linear_cost_to(advent_of_code_example, t) for t in targets]
+    assert non_linear[5] == 168
+
+
+def test_calculate_cost_curves_without_numpy(advent_of_code_example, monkeypatch):
+    monkeypatch.setattr(horizontal_positions, 'np', None)
+    linear, non_linear = calculate_cost_curves(advent_of_code_example)
+
+    assert isinstance(linear, list)
+    assert linear[2] == 37
+    assert non_linear[5] == 168
+    assert len(non_linear) == 17
+
+
+def test_find_convex_optimum_with_built_in_costs(advent_of_code_example):
+    assert find_convex_optimum(advent_of_code_example) == (2, 37)
+    assert find_convex_optimum(advent_of_code_example, _get_linear_cost) == (2, 37)
+    assert find_convex_optimum(advent_of_code_example, _get_non_linear_cost) == (5, 168)
+
+
+def test_find_convex_optimum_with_custom_cost():
+    rng = random.Random(22)
+
+    def squared(distance): return distance ** 2 + 3 * distance
+
+    for _ in range(50):
+        crabs = [rng.randrange(100) for _ in range(rng.randrange(1, 20))]
+        costs = {t: sum(squared(abs(c - t)) for c in crabs) for t in range(max(crabs) + 1)}
+        best = min(costs, key=lambda t: (costs[t], t))
+
+        assert find_convex_optimum(crabs, squared) == (best, costs[best])
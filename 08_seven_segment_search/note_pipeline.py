@@ -0,0 +1,71 @@
+"""
+Streams the notes through a process pool in chunks. Each worker decodes its
+chunk and only returns the two puzzle answers for it, so no per-note results
+are kept in memory.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterator, List, Tuple
+import os
+from search import INPUT_FILE, parse_mask_note, decode_mask_note, list_to_int
+
+EASY_DIGITS = {1, 4, 7, 8}
+
+
+def read_note_chunks(filename=INPUT_FILE, chunk_size=10_000) -> Iterator[List[str]]:
+    """
+    Yields the lines of the file in lists of at most chunk_size lines.
+    """
+    with open(filename) as file:
+        lines = filter(str.strip, file)
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def process_chunk(lines: List[str]) -> Tuple[int, int]:
+    """
+    Returns the number of 1, 4, 7 and 8 digits in the outputs and the sum
+    of the output values of the given notes.
+    """
+    count = total = 0
+    for line in lines:
+        digits = decode_mask_note(parse_mask_note(line))
+        count += sum(1 for digit in digits if digit in EASY_DIGITS)
+        total += list_to_int(digits)
+    return count, total
+
+
+def run_pipeline(filename=INPUT_FILE, workers=None, chunk_size=10_000) -> Tuple[int, int]:
+    """
+    Returns the part 1 count and the part 2 sum. Only a couple of chunks per
+    worker are read ahead, so the memory use does not grow with the file.
+    """
+    workers = workers or os.cpu_count()
+    count = total = 0
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+
+        for chunk in read_note_chunks(filename, chunk_size):
+            pending.append(executor.submit(process_chunk, chunk))
+
+            if len(pending) >= workers * 2:
+                chunk_count, chunk_total = pending.popleft().result()
+                count, total = count + chunk_count, total + chunk_total
+
+        for future in pending:
+            chunk_count, chunk_total = future.result()
+            count, total = count + chunk_count, total + chunk_total
+
+    return count, total
+
+
+if __name__ == '__main__':
+    count_1_4_7_8, total = run_pipeline()
+
+    print(f'Part 1: count is {count_1_4_7_8}.')
+    print(f'Part 2: Sum is {total}.')
@@ -0,0 +1,37 @@
+from note_pipeline import read_note_chunks, process_chunk, run_pipeline
+from pytest import fixture
+
+# The larger example from the puzzle description
+EXAMPLE = '''\
+be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe
+edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc
+fgaebd cg bdaec gdafb agbcfd gdcbef bgcad gfac gcb cdgabef | cg cg fdcagb cbg
+fbegcd cbd adcefb dageb afcb bc aefdc ecdab fgdeca fcdbega | efabcd cedba gadfec cb
+aecbfdg fbg gf bafeg dbefa fcge gcbea fcaegb dgceab fcbdga | gecf egdcabf bgf bfgea
+fgeab ca afcebg bdacfeg cfaedg gcfdb baec bfadeg bafgc acf | gebdcfa ecba ca fadegcb
+dbcfg fgd bdegcaf fgec aegbdf ecdfab fbedc dacgb gdcebf gf | cefg dcbef fcge gbcadfe
+bdfegc cbegaf gecbf dfcage bdacg ed bedf ced adcbefg gebcd | ed bcgafe cdgba cbgef
+egadfb cdbfeg cegd fecab cgb gbdefca cg fgcdab egfdb bfceg | gbdfcae bgc cg cgb
+gcafb gcf dcaebfg ecagb gf abcdeg gaef cafbge fdbac fegbdc | fgae cfgab fg bagce
+'''
+
+
+@fixture
+def example_file(tmp_path):
+    path = tmp_path / 'notes.txt'
+    path.write_text(EXAMPLE)
+    return str(path)
+
+
+def test_read_note_chunks(example_file):
+    chunks = list(read_note_chunks(example_file, chunk_size=4))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+
+
+def test_process_chunk():
+    assert process_chunk(EXAMPLE.splitlines()) == (26, 61_229)
+
+
+def test_run_pipeline(example_file):
+    assert run_pipeline(example_file, workers=2, chunk_size=3) == (26, 61_229)
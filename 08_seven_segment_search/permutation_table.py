@@ -0,0 +1,137 @@
+"""
+Decodes notes with a precomputed table of all 7! = 5040 ways the wires can be
+mixed up. Each wiring maps the ten digits to a different set of ten patterns,
+so the sorted patterns of a note identify its wiring with a single dict lookup.
+
+The table is built lazily on first use and saved to disk in the user's cache
+directory, so that later processes can load it instead of building it again.
+The file is a short header followed by the flat bytes of every entry, which
+loads in a fraction of the time it takes to build the table.
+"""
+from itertools import permutations
+from typing import Dict, List, Optional
+import os
+import struct
+import tempfile
+import zlib
+from search import INPUT_FILE, parse_mask_note, MaskNote
+
+CACHE_DIR = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+TABLE_FILE = os.path.join(CACHE_DIR, 'advent-of-code-2021', 'seven_segment_permutations.bin')
+
+WIRINGS = 5040
+
+# File format version and the size of one entry: ten sorted masks and their ten digits
+MAGIC = b'SSPT\x01'
+ENTRY_SIZE = 20
+
+# The segments of each digit on a correctly wired display
+DIGIT_PATTERNS = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+
+# Sorted pattern masks of a note as bytes => the digits of those masks in the same order
+Table = Dict[bytes, bytes]
+
+_table: Optional[Table] = None
+
+
+def build_table() -> Table:
+    """
+    Rewires the correct digit patterns with every permutation of the seven wires.
+    """
+    table = {}
+    for wiring in permutations(range(7)):
+        rewired = {}
+        for digit, pattern in enumerate(DIGIT_PATTERNS):
+            mask = 0
+            for segment in pattern:
+                mask |= 1 << wiring[ord(segment) - ord('a')]
+            rewired[mask] = digit
+
+        signature = bytes(sorted(rewired))
+        table[signature] = bytes(rewired[mask] for mask in signature)
+    return table
+
+
+def save_table(table: Table, filename: str):
+    """
+    Writes the table into a temporary file first and then replaces the target,
+    so that other processes never see a partially written table. The header
+    holds a checksum of the entries.
+    """
+    directory = os.path.dirname(filename) or '.'
+    os.makedirs(directory, exist_ok=True)
+
+    payload = b''.join(masks + digits for masks, digits in table.items())
+    data = MAGIC + struct.pack('>I', zlib.crc32(payload)) + payload
+
+    with tempfile.NamedTemporaryFile('wb', dir=directory, suffix='.tmp', delete=False) as file:
+        try:
+            file.write(data)
+        except BaseException:
+            file.close()
+            os.remove(file.name)
+            raise
+    os.replace(file.name, filename)
+
+
+def is_valid_table(table: Table) -> bool:
+    """
+    A valid table has an entry for every wiring, and each entry maps ten
+    different 7-bit masks to the digits 0-9.
+    """
+    return len(table) == WIRINGS and all(
+        len(masks) == 10 and len(set(masks)) == 10
+        and all(0 < mask < 128 for mask in masks)
+        and sorted(digits) == list(range(10))
+        for masks, digits in table.items())
+
+
+def load_table(filename: str) -> Table:
+    """
+    Loads a saved table. Raises ValueError if the file has the wrong version,
+    size or checksum. Only tables that passed is_valid_table are ever saved, so
+    an intact file does not need to be validated entry by entry.
+    """
+    with open(filename, 'rb') as file:
+        data = file.read()
+
+    header = len(MAGIC) + 4
+    payload = data[header:]
+    if (not data.startswith(MAGIC) or len(payload) != WIRINGS * ENTRY_SIZE
+            or struct.unpack('>I', data[len(MAGIC):header])[0] != zlib.crc32(payload)):
+        raise ValueError(f'Invalid permutation table in {filename}')
+
+    return {payload[i:i + 10]: payload[i + 10:i + ENTRY_SIZE] for i in range(0, len(payload), ENTRY_SIZE)}
+
+
+def get_table(filename=TABLE_FILE) -> Table:
+    """
+    Returns the table, loading it from the file or building and saving it on first use.
+    """
+    global _table
+    if _table is None:
+        try:
+            _table = load_table(filename)
+        except (OSError, ValueError):
+            _table = build_table()
+            try:
+                save_table(_table, filename)
+            except OSError:
+                pass  # the table still works, it just is not reused by other processes
+    return _table
+
+
+def decode_with_table(note: MaskNote, table: Table = None) -> List[int]:
+    """
+    Decodes a MaskNote into a list of ints, same as decode_mask_note.
+    """
+    signature = bytes(sorted(note.patterns))
+    digits = (table or get_table())[signature]
+    decoded = dict(zip(signature, digits))
+    return [decoded[mask] for mask in note.output]
+
+
+if __name__ == '__main__':
+    with open(INPUT_FILE) as file:
+        for line in file:
+            print(decode_with_table(parse_mask_note(line)))
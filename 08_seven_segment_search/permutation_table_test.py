@@ -0,0 +1,67 @@
+from search import parse_mask_note, decode_mask_note
+from permutation_table import build_table, save_table, load_table, get_table, decode_with_table, is_valid_table
+import permutation_table
+import os
+from pytest import fixture
+
+
+@fixture
+def entries():
+    return [
+        'acedgfb cdfbe gcdfa fbcad dab cefabd cdfgeb eafb cagedb ab | cdfeb fcadb cdfeb cdbaf',
+        'be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe',
+        'edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc',
+    ]
+
+
+def test_build_table_has_every_wiring():
+    table = build_table()
+
+    assert len(table) == 5040
+    assert all(sorted(digits) == list(range(10)) for digits in table.values())
+
+
+def test_decode_with_table(entries):
+    table = build_table()
+
+    for entry in entries:
+        note = parse_mask_note(entry)
+        assert decode_with_table(note, table) == decode_mask_note(note)
+
+
+def test_table_is_saved_and_reused(tmp_path, monkeypatch, entries):
+    filename = str(tmp_path / 'table.bin')
+    monkeypatch.setattr(permutation_table, '_table', None)
+
+    table = get_table(filename)
+    assert load_table(filename) == table
+
+    monkeypatch.setattr(permutation_table, '_table', None)
+    monkeypatch.setattr(permutation_table, 'build_table', None)  # must not be rebuilt
+    assert get_table(filename) == table
+    assert decode_with_table(parse_mask_note(entries[0])) == [5, 3, 5, 3]
+
+
+def test_save_and_load_table(tmp_path):
+    filename = str(tmp_path / 'cache' / 'table.bin')
+    table = build_table()
+
+    save_table(table, filename)
+    assert load_table(filename) == table
+    assert os.listdir(tmp_path / 'cache') == ['table.bin']
+
+
+def test_invalid_table_file_is_rebuilt(tmp_path, monkeypatch, entries):
+    filename = tmp_path / 'table.bin'
+    save_table(build_table(), str(filename))
+    valid = filename.read_bytes()
+    corrupted = valid[:-1] + bytes([valid[-1] ^ 1])
+
+    for contents in (b'', b'{}', b'[[[1,2],[3]]]', valid[:100], valid + b'\x00', corrupted):
+        filename.write_bytes(contents)
+        monkeypatch.setattr(permutation_table, '_table', None)
+
+        table = get_table(str(filename))
+        assert is_valid_table(table)
+        assert decode_with_table(parse_mask_note(entries[0])) == [5, 3, 5, 3]
+        assert load_table(str(filename)) == table
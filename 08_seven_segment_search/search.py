@@ -1,11 +1,14 @@
 import os
-from typing import List, Set
+from typing import Dict, Iterable, List, Set
 from collections import namedtuple
 
 INPUT_FILE = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 Note = namedtuple('Note', 'patterns output')
 
+# A Note where each pattern is a 7-bit mask with bit 0 for segment a, bit 1 for b and so on
+MaskNote = namedtuple('MaskNote', 'patterns output')
+
 
 def read_notes(filename=INPUT_FILE) -> List[Note]:
     """
@@ -139,6 +142,72 @@ def filter_by_length(patterns: Set[str], length: int) -> List[str]:
     return [p for p in patterns if len(p) == length]
 
 
+def pattern_to_mask(pattern: str) -> int:
+    """
+    Converts a segment pattern such as 'abd' into a bitmask such as 0b1011.
+    """
+    mask = 0
+    for segment in pattern:
+        mask |= 1 << (ord(segment) - ord('a'))
+    return mask
+
+
+def parse_mask_note(entry: str) -> MaskNote:
+    """
+    Like parse_note, but converts the patterns straight into bitmasks. The
+    segments don't need to be sorted, because the mask does not depend on
+    their order.
+    """
+    patterns, output = entry.split('|')
+    return MaskNote(list(map(pattern_to_mask, patterns.split())), list(map(pattern_to_mask, output.split())))
+
+
+def popcount(mask: int) -> int:
+    return bin(mask).count('1')
+
+
+def decode_masks(patterns: Iterable[int]) -> Dict[int, int]:
+    """
+    Returns a dict with the ten pattern masks as keys and their digits as values.
+    The digits are told apart by their number of segments and by how many
+    segments they share with 1 and 4:
+
+    5 segments: 3 has both segments of 1, 2 shares two segments with 4, 5 shares three.
+    6 segments: 6 has one segment of 1, 9 has all four segments of 4, 0 has three.
+    """
+    patterns = list(patterns)
+    one = next(mask for mask in patterns if popcount(mask) == 2)
+    four = next(mask for mask in patterns if popcount(mask) == 4)
+
+    unique_lengths = {2: 1, 3: 7, 4: 4, 7: 8}
+    decoded = {}
+
+    for mask in patterns:
+        length = popcount(mask)
+        if length in unique_lengths:
+            decoded[mask] = unique_lengths[length]
+        elif length == 5:
+            if popcount(mask & one) == 2:
+                decoded[mask] = 3
+            else:
+                decoded[mask] = 2 if popcount(mask & four) == 2 else 5
+        else:
+            if popcount(mask & one) == 1:
+                decoded[mask] = 6
+            else:
+                decoded[mask] = 9 if popcount(mask & four) == 4 else 0
+
+    return decoded
+
+
+def decode_mask_note(note: MaskNote) -> List[int]:
+    """
+    Decodes a MaskNote into a list of ints, same as decode_note.
+    """
+    decoded = decode_masks(note.patterns)
+    return [decoded[mask] for mask in note.output]
+
+
 def list_to_int(nums):
     return int(''.join(map(str, nums)))
 
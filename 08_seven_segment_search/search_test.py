@@ -28,3 +28,28 @@ def test_decode_four(sample_input):
 def test_decode_seven(sample_input):
     note = parse_note(sample_input)
     assert decode_seven(note.patterns) == 'abd'
+
+
+def test_pattern_to_mask():
+    assert pattern_to_mask('abd') == 0b1011
+    assert pattern_to_mask('dba') == 0b1011
+    assert pattern_to_mask('abcdefg') == 0b1111111
+
+
+def test_decode_masks_with_unscrambled_segments():
+    digits = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+    decoded = decode_masks(map(pattern_to_mask, digits))
+
+    assert decoded == {pattern_to_mask(pattern): digit for digit, pattern in enumerate(digits)}
+
+
+def test_decode_mask_note_matches_decode_note(sample_input):
+    assert decode_mask_note(parse_mask_note(sample_input)) == [5, 3, 5, 3]
+
+    entries = [
+        'be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe',
+        'edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc',
+        'fgaebd cg bdaec gdafb agbcfd gdcbef bgcad gfac gcb cdgabef | cg cg fdcagb cbg',
+    ]
+    for entry in entries:
+        assert decode_mask_note(parse_mask_note(entry)) == decode_note(parse_note(entry))